@@ -27,6 +27,7 @@ from ac_bridge.protocol import (
     TelemetryFrame,
     ControlCommand,
     Transition,
+    TransitionBatch,
     Message,
     MessageType,
     Codec,
@@ -39,6 +40,10 @@ from ac_bridge.action_smoother import (
     get_moderate_config,
     get_aggressive_config,
     get_no_smoothing_config,
+    CONSERVATIVE_CONFIG,
+    MODERATE_CONFIG,
+    AGGRESSIVE_CONFIG,
+    NO_SMOOTHING_CONFIG,
 )
 
 __version__ = "0.3.0"
@@ -54,6 +59,7 @@ __all__ = [
     "TelemetryFrame",
     "ControlCommand",
     "Transition",
+    "TransitionBatch",
     "Message",
     "MessageType",
     "Codec",
@@ -69,5 +75,9 @@ __all__ = [
     "get_moderate_config",
     "get_aggressive_config",
     "get_no_smoothing_config",
+    "CONSERVATIVE_CONFIG",
+    "MODERATE_CONFIG",
+    "AGGRESSIVE_CONFIG",
+    "NO_SMOOTHING_CONFIG",
 ]
 
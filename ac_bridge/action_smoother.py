@@ -3,26 +3,194 @@ Action smoothing and rate limiting for stable RL training.
 
 Implements:
 1. Rate limiting (max delta per step)
-2. Low-pass filtering (EMA smoothing)
+2. Low-pass filtering (EMA smoothing, or an adaptive One-Euro filter)
 3. Asymmetric pedal dynamics
 4. Action squashing (hard clamps)
 
 The golden rule: Policy chooses targets, controller decides how fast to reach them.
 """
 
+from math import fabs, pi
+from typing import Literal
+
 import numpy as np
 from dataclasses import dataclass
 import structlog
 
 logger = structlog.get_logger()
 
+# Numba is optional: when present, smooth_inplace() runs through a compiled kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("numba_not_available",
+                 msg="ActionSmoother will use the NumPy path. Install with: uv add numba")
+
+# Channel order used by all per-channel arrays: steer, throttle, brake, clutch
+STEER, THROTTLE, BRAKE, CLUTCH = range(4)
+
+
+def _smooth_kernel(
+    x: np.ndarray,
+    prev: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    max_up: np.ndarray,
+    max_down: np.ndarray,
+    alpha: np.ndarray,
+    one_minus_alpha: np.ndarray,
+    rate_limiting: bool,
+    ema_smoothing: bool,
+    track_stats: bool,
+    total_delta: np.ndarray
+) -> None:
+    """
+    Scalar smoothing loop over all channels (compiled with numba if available).
+    
+    Clamps and rate-limits (as one corridor clip), EMA-filters ``x`` in
+    place, then writes the result back into ``prev`` and, if ``track_stats``,
+    accumulates ``|x - prev|`` into ``total_delta``. Same math as the NumPy
+    path in ActionSmoother.smooth_inplace(), including the reasoning for why
+    no final clamp is needed.
+    """
+    for i in range(x.shape[0]):
+        p = prev[i]
+        
+        if rate_limiting:
+            # Clamp and rate limit in one step: clip to the reachable corridor
+            # [prev - max_down, prev + max_up] intersected with [lo, hi]
+            v = min(max(x[i], max(lo[i], p - max_down[i])), min(hi[i], p + max_up[i]))
+        else:
+            v = min(max(x[i], lo[i]), hi[i])
+        
+        if ema_smoothing:
+            v = alpha[i] * v + one_minus_alpha[i] * p
+        
+        if track_stats:
+            total_delta[i] += fabs(v - p)
+        prev[i] = v
+        x[i] = v
+
+
+if NUMBA_AVAILABLE:
+    # Eager signature: compiled (or loaded from the on-disk cache) at import
+    # time, so no ActionSmoother ever pays JIT latency on a control step.
+    _f4 = "float32[::1]"
+    _smooth_kernel = njit(
+        f"void({_f4}, {_f4}, {_f4}, {_f4}, {_f4}, {_f4}, {_f4}, {_f4}, "
+        f"boolean, boolean, boolean, float64[::1])",
+        cache=True,
+        fastmath=True
+    )(_smooth_kernel)
 
-@dataclass
+
+def _one_euro_kernel(
+    x: np.ndarray,
+    prev: np.ndarray,
+    dx: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    max_up: np.ndarray,
+    max_down: np.ndarray,
+    rate_limiting: bool,
+    min_cutoff: float,
+    beta: float,
+    d_alpha: float,
+    inv_dt: float,
+    two_pi_dt: float,
+    track_stats: bool,
+    total_delta: np.ndarray
+) -> None:
+    """
+    Scalar One-Euro loop over all channels (compiled with numba if available).
+    
+    Like _smooth_kernel(), but the EMA alpha adapts per channel: the rate of
+    change is low-passed into ``dx`` and raises the cutoff frequency, so
+    fast moves pass with little lag and small jitter is smoothed hard.
+    Same math as _one_euro_update().
+    """
+    for i in range(x.shape[0]):
+        p = prev[i]
+        
+        if rate_limiting:
+            v = min(max(x[i], max(lo[i], p - max_down[i])), min(hi[i], p + max_up[i]))
+        else:
+            v = min(max(x[i], lo[i]), hi[i])
+        
+        d = d_alpha * ((v - p) * inv_dt) + (1.0 - d_alpha) * dx[i]
+        dx[i] = d
+        r = two_pi_dt * (min_cutoff + beta * fabs(d))
+        a = r / (r + 1.0)
+        v = a * v + (1.0 - a) * p
+        
+        if track_stats:
+            total_delta[i] += fabs(v - p)
+        prev[i] = v
+        x[i] = v
+
+
+if NUMBA_AVAILABLE:
+    _one_euro_kernel = njit(
+        f"void({_f4}, {_f4}, {_f4}, {_f4}, {_f4}, {_f4}, {_f4}, boolean, "
+        f"float64, float64, float64, float64, float64, boolean, float64[::1])",
+        cache=True,
+        fastmath=True
+    )(_one_euro_kernel)
+
+
+def _one_euro_update(
+    x: np.ndarray,
+    prev: np.ndarray,
+    dx: np.ndarray,
+    buf_a: np.ndarray,
+    buf_b: np.ndarray,
+    min_cutoff: float,
+    beta: float,
+    d_alpha: float,
+    inv_dt: float,
+    two_pi_dt: float
+) -> None:
+    """
+    One-Euro smoothing phase, in place on arrays of any matching shape.
+    
+    With dt the control period:
+        dx    <- EMA(d_alpha) of (x - prev) / dt
+        alpha  = 1 / (1 + 1 / (2*pi*cutoff*dt)),  cutoff = min_cutoff + beta*|dx|
+        x     <- alpha*x + (1 - alpha)*prev
+    
+    alpha is always in (0, 1), so x stays between prev and its clamped
+    target. ``buf_a``/``buf_b`` are scratch arrays shaped like ``x``.
+    """
+    # Low-passed rate of change
+    np.subtract(x, prev, out=buf_a)
+    np.multiply(buf_a, d_alpha * inv_dt, out=buf_a)
+    np.multiply(dx, 1.0 - d_alpha, out=dx)
+    np.add(dx, buf_a, out=dx)
+    
+    # Adaptive alpha: r / (r + 1) with r = 2*pi*cutoff*dt
+    np.abs(dx, out=buf_b)
+    np.multiply(buf_b, beta, out=buf_b)
+    np.add(buf_b, min_cutoff, out=buf_b)
+    np.multiply(buf_b, two_pi_dt, out=buf_b)
+    np.add(buf_b, 1.0, out=buf_a)
+    np.divide(buf_b, buf_a, out=buf_b)
+    
+    # EMA with the adaptive alpha (convex form, see ActionSmoother)
+    np.multiply(x, buf_b, out=x)
+    np.subtract(1.0, buf_b, out=buf_b)
+    np.multiply(buf_b, prev, out=buf_b)
+    np.add(x, buf_b, out=x)
+
+
+@dataclass(frozen=True, slots=True)
 class SmoothingConfig:
     """
     Configuration for action smoothing.
     
-    All features can be enabled/disabled independently.
+    All features can be enabled/disabled independently. Instances are
+    immutable; use dataclasses.replace() to derive a modified config.
     """
     
     # Rate limiting (max delta per step)
@@ -41,11 +209,23 @@ class SmoothingConfig:
     brake_alpha: float = 0.7           # Can be asymmetric
     clutch_alpha: float = 0.8          # Less smoothing for clutch
     
+    # Filter used by the smoothing phase: fixed-alpha EMA (above) or One-Euro,
+    # whose cutoff rises with the rate of change (less lag on fast moves,
+    # more smoothing of small jitter)
+    filter_type: Literal["ema", "one_euro"] = "ema"
+    one_euro_min_cutoff: float = 1.5   # Hz, cutoff when the input is still
+    one_euro_beta: float = 0.5         # Cutoff increase per unit/s of change
+    one_euro_d_cutoff: float = 1.0     # Hz, cutoff for the rate estimate
+    one_euro_dt: float = 0.1           # Control period in seconds (10 Hz)
+    
     # Hard clamps (always enabled)
     clamp_steer_min: float = -1.0
     clamp_steer_max: float = 1.0
     clamp_pedals_min: float = 0.0
     clamp_pedals_max: float = 1.0
+    
+    # Statistics for get_stats() (off by default to keep smooth() lean)
+    track_stats: bool = False
 
 
 class ActionSmoother:
@@ -72,22 +252,100 @@ class ActionSmoother:
         """
         self.config = config or SmoothingConfig()
         
-        # State tracking
-        self._prev_steer = 0.0
-        self._prev_throttle = 0.0
-        self._prev_brake = 0.0
-        self._prev_clutch = 0.0
+        cfg = self.config
+        
+        # smooth() relies on these to keep outputs in range without a final clamp
+        for name in ('steer_alpha', 'throttle_alpha', 'brake_alpha', 'clutch_alpha'):
+            if not 0.0 <= getattr(cfg, name) <= 1.0:
+                raise ValueError(f"{name} must be in [0, 1], got {getattr(cfg, name)}")
+        for name in ('max_steer_delta', 'max_throttle_up', 'max_throttle_down',
+                     'max_brake_up', 'max_brake_down', 'max_clutch_delta'):
+            if getattr(cfg, name) < 0.0:
+                raise ValueError(f"{name} must be non-negative, got {getattr(cfg, name)}")
+        if cfg.filter_type not in ("ema", "one_euro"):
+            raise ValueError(f"filter_type must be 'ema' or 'one_euro', got {cfg.filter_type!r}")
+        for name in ('one_euro_min_cutoff', 'one_euro_d_cutoff', 'one_euro_dt'):
+            if getattr(cfg, name) <= 0.0:
+                raise ValueError(f"{name} must be positive, got {getattr(cfg, name)}")
+        if cfg.one_euro_beta < 0.0:
+            raise ValueError(f"one_euro_beta must be non-negative, got {cfg.one_euro_beta}")
+        
+        # Per-channel coefficients (SoA layout: steer, throttle, brake, clutch).
+        # float32 throughout: outputs drive a 15-bit vJoy axis, so float64
+        # precision buys nothing.
+        self._lo = np.array([
+            cfg.clamp_steer_min, cfg.clamp_pedals_min,
+            cfg.clamp_pedals_min, cfg.clamp_pedals_min
+        ], dtype=np.float32)
+        self._hi = np.array([
+            cfg.clamp_steer_max, cfg.clamp_pedals_max,
+            cfg.clamp_pedals_max, cfg.clamp_pedals_max
+        ], dtype=np.float32)
+        self._max_up = np.array([
+            cfg.max_steer_delta, cfg.max_throttle_up,
+            cfg.max_brake_up, cfg.max_clutch_delta
+        ], dtype=np.float32)
+        self._max_down = np.array([
+            cfg.max_steer_delta, cfg.max_throttle_down,
+            cfg.max_brake_down, cfg.max_clutch_delta
+        ], dtype=np.float32)
+        self._alpha = np.array([
+            cfg.steer_alpha, cfg.throttle_alpha,
+            cfg.brake_alpha, cfg.clutch_alpha
+        ], dtype=np.float32)
+        
+        self._one_minus_alpha = 1.0 - self._alpha
+        
+        # One-Euro coefficients (scalars shared by all channels)
+        self._one_euro_min_cutoff = cfg.one_euro_min_cutoff
+        self._one_euro_beta = cfg.one_euro_beta
+        self._one_euro_inv_dt = 1.0 / cfg.one_euro_dt
+        self._one_euro_two_pi_dt = 2.0 * pi * cfg.one_euro_dt
+        d_r = self._one_euro_two_pi_dt * cfg.one_euro_d_cutoff
+        self._one_euro_d_alpha = d_r / (d_r + 1.0)
+        
+        # Feature flags, cached so smooth() doesn't walk self.config per call
+        self._rate_limiting = cfg.enable_rate_limiting
+        self._ema_smoothing = cfg.enable_ema_smoothing
+        self._one_euro = cfg.enable_ema_smoothing and cfg.filter_type == "one_euro"
+        self._track_stats = cfg.track_stats
+        
+        # Neutral state: 0 clipped into each channel's clamp range, so prev
+        # starts inside [lo, hi] even for ranges that exclude 0
+        self._neutral = np.clip(np.zeros(4, dtype=np.float32), self._lo, self._hi)
+        
+        # State tracking (previous smoothed output per channel)
+        self._prev = self._neutral.copy()
+        self._prev_batch = None  # (N, 4), allocated on first smooth_batch()
+        self._dx = np.zeros(4, dtype=np.float32)  # One-Euro rate estimate
+        self._dx_batch = None
+        
+        # Scratch buffers so the NumPy path of smooth_inplace() never allocates
+        self._scratch_lo = np.empty(4, dtype=np.float32)
+        self._scratch_hi = np.empty(4, dtype=np.float32)
+        
+        # smooth_inplace() body specialized for this config
+        if self._one_euro:
+            self._smooth_impl = self._smooth_one_euro_numba if NUMBA_AVAILABLE else self._smooth_one_euro
+        elif NUMBA_AVAILABLE:
+            self._smooth_impl = self._smooth_numba
+        else:
+            self._smooth_impl = {
+                (True, True): self._smooth_full,
+                (True, False): self._smooth_rate_only,
+                (False, True): self._smooth_ema_only,
+                (False, False): self._smooth_clamp_only,
+            }[(self._rate_limiting, self._ema_smoothing)]
         
         # Statistics
         self._step_count = 0
-        self._total_steer_delta = 0.0
-        self._total_throttle_delta = 0.0
-        self._total_brake_delta = 0.0
+        self._total_delta = np.zeros(4)  # float64: accumulates over many steps
         
         logger.info(
             "action_smoother_initialized",
             rate_limiting=self.config.enable_rate_limiting,
             ema_smoothing=self.config.enable_ema_smoothing,
+            filter_type=self.config.filter_type,
             max_steer_delta=self.config.max_steer_delta
         )
     
@@ -110,110 +368,217 @@ class ActionSmoother:
         Returns:
             (smooth_steer, smooth_throttle, smooth_brake, smooth_clutch)
         """
-        # Phase 0: Hard clamps on inputs (always applied)
-        steer = np.clip(steer, self.config.clamp_steer_min, self.config.clamp_steer_max)
-        throttle = np.clip(throttle, self.config.clamp_pedals_min, self.config.clamp_pedals_max)
-        brake = np.clip(brake, self.config.clamp_pedals_min, self.config.clamp_pedals_max)
-        clutch = np.clip(clutch, self.config.clamp_pedals_min, self.config.clamp_pedals_max)
-        
-        # Phase 1: Rate limiting (if enabled)
-        if self.config.enable_rate_limiting:
-            steer = self._apply_rate_limit(
-                steer, self._prev_steer,
-                self.config.max_steer_delta,
-                self.config.max_steer_delta
-            )
-            
-            # Asymmetric pedal dynamics
-            throttle = self._apply_rate_limit(
-                throttle, self._prev_throttle,
-                self.config.max_throttle_up,
-                self.config.max_throttle_down
-            )
-            
-            brake = self._apply_rate_limit(
-                brake, self._prev_brake,
-                self.config.max_brake_up,
-                self.config.max_brake_down
-            )
-            
-            clutch = self._apply_rate_limit(
-                clutch, self._prev_clutch,
-                self.config.max_clutch_delta,
-                self.config.max_clutch_delta
+        x = np.array([steer, throttle, brake, clutch], dtype=np.float32)
+        self._smooth_impl(x, x)
+        
+        steer, throttle, brake, clutch = x.tolist()
+        return steer, throttle, brake, clutch
+    
+    def smooth_inplace(self, target: np.ndarray, out: np.ndarray) -> None:
+        """
+        Apply smoothing without allocating (same state and math as smooth()).
+        
+        The caller owns ``out`` and may reuse it every step; passing the same
+        array as ``target`` and ``out`` is allowed.
+        
+        Args:
+            target: Target action [steer, throttle, brake, clutch]
+            out: Contiguous float32 array of shape (4,) that receives the
+                 smoothed action
+        
+        Raises:
+            ValueError: If ``out`` is not a C-contiguous float32 array of shape (4,)
+        """
+        if out.dtype != np.float32 or not out.flags.c_contiguous or out.shape != (4,):
+            raise ValueError(
+                f"out must be a C-contiguous float32 array of shape (4,), "
+                f"got {out.dtype} {out.shape} (contiguous={out.flags.c_contiguous})"
             )
+        self._smooth_impl(target, out)
+    
+    # Specialized smooth_inplace() bodies, one per (rate_limiting,
+    # ema_smoothing) combination, picked once in __init__ so the hot path
+    # carries no feature-flag branches.
+    #
+    # No final clamp is needed in any of them: prev starts (at _neutral) and
+    # stays inside [lo, hi] and Phase 1 clips into a sub-range of [lo, hi]. The EMA is a
+    # convex combination of two in-range values (alpha in [0, 1]), so it is
+    # in range as well.
+    #
+    # The EMA is deliberately written alpha*x + (1 - alpha)*prev rather than
+    # the incremental prev + alpha*(x - prev): both cost three ufuncs, but in
+    # float32 the incremental form can round a hair past x when x sits on a
+    # clamp bound, which would break the no-final-clamp invariant.
+    
+    def _smooth_numba(self, target: np.ndarray, out: np.ndarray) -> None:
+        np.copyto(out, target)
+        _smooth_kernel(
+            out, self._prev, self._lo, self._hi,
+            self._max_up, self._max_down, self._alpha, self._one_minus_alpha,
+            self._rate_limiting, self._ema_smoothing, self._track_stats,
+            self._total_delta
+        )
+        if self._track_stats:
+            self._step_count += 1
+    
+    def _smooth_one_euro_numba(self, target: np.ndarray, out: np.ndarray) -> None:
+        np.copyto(out, target)
+        _one_euro_kernel(
+            out, self._prev, self._dx, self._lo, self._hi,
+            self._max_up, self._max_down, self._rate_limiting,
+            self._one_euro_min_cutoff, self._one_euro_beta, self._one_euro_d_alpha,
+            self._one_euro_inv_dt, self._one_euro_two_pi_dt,
+            self._track_stats, self._total_delta
+        )
+        if self._track_stats:
+            self._step_count += 1
+    
+    def _smooth_one_euro(self, target: np.ndarray, out: np.ndarray) -> None:
+        prev = self._prev
+        lo_buf = self._scratch_lo
+        hi_buf = self._scratch_hi
         
-        # Phase 2: EMA smoothing (if enabled)
-        if self.config.enable_ema_smoothing:
-            steer = self._apply_ema(steer, self._prev_steer, self.config.steer_alpha)
-            throttle = self._apply_ema(throttle, self._prev_throttle, self.config.throttle_alpha)
-            brake = self._apply_ema(brake, self._prev_brake, self.config.brake_alpha)
-            clutch = self._apply_ema(clutch, self._prev_clutch, self.config.clutch_alpha)
+        if self._rate_limiting:
+            np.subtract(prev, self._max_down, out=lo_buf)
+            np.maximum(lo_buf, self._lo, out=lo_buf)
+            np.add(prev, self._max_up, out=hi_buf)
+            np.minimum(hi_buf, self._hi, out=hi_buf)
+            np.clip(target, lo_buf, hi_buf, out=out)
+        else:
+            np.clip(target, self._lo, self._hi, out=out)
         
-        # Final clamps (safety)
-        steer = np.clip(steer, self.config.clamp_steer_min, self.config.clamp_steer_max)
-        throttle = np.clip(throttle, self.config.clamp_pedals_min, self.config.clamp_pedals_max)
-        brake = np.clip(brake, self.config.clamp_pedals_min, self.config.clamp_pedals_max)
-        clutch = np.clip(clutch, self.config.clamp_pedals_min, self.config.clamp_pedals_max)
+        _one_euro_update(
+            out, prev, self._dx, lo_buf, hi_buf,
+            self._one_euro_min_cutoff, self._one_euro_beta, self._one_euro_d_alpha,
+            self._one_euro_inv_dt, self._one_euro_two_pi_dt
+        )
         
-        # Track statistics
-        self._total_steer_delta += abs(steer - self._prev_steer)
-        self._total_throttle_delta += abs(throttle - self._prev_throttle)
-        self._total_brake_delta += abs(brake - self._prev_brake)
+        self._commit(out)
+    
+    def _smooth_full(self, target: np.ndarray, out: np.ndarray) -> None:
+        prev = self._prev
+        lo_buf = self._scratch_lo
+        hi_buf = self._scratch_hi
         
-        # Update previous values
-        self._prev_steer = steer
-        self._prev_throttle = throttle
-        self._prev_brake = brake
-        self._prev_clutch = clutch
+        # Phase 1: Hard clamps + rate limiting (asymmetric for pedals).
+        # Clamping then limiting the delta is the same as one clip to the
+        # intersection of both ranges.
+        np.subtract(prev, self._max_down, out=lo_buf)
+        np.maximum(lo_buf, self._lo, out=lo_buf)
+        np.add(prev, self._max_up, out=hi_buf)
+        np.minimum(hi_buf, self._hi, out=hi_buf)
+        np.clip(target, lo_buf, hi_buf, out=out)
         
-        self._step_count += 1
+        # Phase 2: EMA smoothing; lo_buf is free again here
+        np.multiply(out, self._alpha, out=out)
+        np.multiply(prev, self._one_minus_alpha, out=lo_buf)
+        np.add(out, lo_buf, out=out)
         
-        return steer, throttle, brake, clutch
+        self._commit(out)
     
-    def _apply_rate_limit(
-        self,
-        target: float,
-        prev: float,
-        max_up_rate: float,
-        max_down_rate: float
-    ) -> float:
-        """
-        Apply asymmetric rate limiting.
+    def _smooth_rate_only(self, target: np.ndarray, out: np.ndarray) -> None:
+        prev = self._prev
+        lo_buf = self._scratch_lo
+        hi_buf = self._scratch_hi
         
-        Args:
-            target: Target value
-            prev: Previous value
-            max_up_rate: Max increase per step
-            max_down_rate: Max decrease per step
+        np.subtract(prev, self._max_down, out=lo_buf)
+        np.maximum(lo_buf, self._lo, out=lo_buf)
+        np.add(prev, self._max_up, out=hi_buf)
+        np.minimum(hi_buf, self._hi, out=hi_buf)
+        np.clip(target, lo_buf, hi_buf, out=out)
         
-        Returns:
-            Rate-limited value
-        """
-        delta = target - prev
+        self._commit(out)
+    
+    def _smooth_ema_only(self, target: np.ndarray, out: np.ndarray) -> None:
+        lo_buf = self._scratch_lo
         
-        if delta > 0:
-            # Increasing
-            delta = min(delta, max_up_rate)
-        else:
-            # Decreasing
-            delta = max(delta, -max_down_rate)
+        np.clip(target, self._lo, self._hi, out=out)
+        
+        np.multiply(out, self._alpha, out=out)
+        np.multiply(self._prev, self._one_minus_alpha, out=lo_buf)
+        np.add(out, lo_buf, out=out)
+        
+        self._commit(out)
+    
+    def _smooth_clamp_only(self, target: np.ndarray, out: np.ndarray) -> None:
+        np.clip(target, self._lo, self._hi, out=out)
+        self._commit(out)
+    
+    def _commit(self, out: np.ndarray) -> None:
+        """Track statistics and store ``out`` as the new previous output."""
+        prev = self._prev
         
-        return prev + delta
+        if self._track_stats:
+            buf = self._scratch_lo
+            np.subtract(out, prev, out=buf)
+            np.abs(buf, out=buf)
+            self._total_delta += buf
+            self._step_count += 1
+        
+        prev[:] = out
     
-    def _apply_ema(self, target: float, prev: float, alpha: float) -> float:
+    def smooth_batch(self, targets: np.ndarray) -> np.ndarray:
         """
-        Apply exponential moving average smoothing.
+        Apply smoothing to a batch of target actions (vectorized envs).
+        
+        Each row is smoothed independently against its own previous output,
+        using the same config as smooth(). Batch state is separate from the
+        smooth()/smooth_inplace() state and is allocated on the first call;
+        the batch size must stay fixed until reset(). Statistics are only
+        tracked for smooth()/smooth_inplace().
         
         Args:
-            target: Target value
-            prev: Previous smoothed value
-            alpha: Smoothing factor (0=full smoothing, 1=no smoothing)
+            targets: Array of shape (N, 4) with columns
+                     [steer, throttle, brake, clutch]
         
         Returns:
-            Smoothed value
+            Smoothed actions, shape (N, 4), float32
         """
-        return alpha * target + (1.0 - alpha) * prev
+        targets = np.asarray(targets, dtype=np.float32)
+        if targets.ndim != 2 or targets.shape[1] != 4:
+            raise ValueError(f"targets must have shape (N, 4), got {targets.shape}")
+        
+        prev = self._prev_batch
+        if prev is None:
+            prev = self._prev_batch = np.broadcast_to(self._neutral, targets.shape).copy()
+            self._dx_batch = np.zeros_like(targets)
+        elif prev.shape != targets.shape:
+            raise ValueError(
+                f"Batch size changed from {prev.shape[0]} to {targets.shape[0]}; "
+                "call reset() first"
+            )
+        
+        lo = self._lo
+        hi = self._hi
+        
+        # Same phases as smooth_inplace(), with two (N, 4) temporaries reused
+        # across both phases
+        if self._rate_limiting:
+            lo_buf = prev - self._max_down
+            np.maximum(lo_buf, lo, out=lo_buf)
+            hi_buf = prev + self._max_up
+            np.minimum(hi_buf, hi, out=hi_buf)
+            x = np.clip(targets, lo_buf, hi_buf)
+        else:
+            x = np.clip(targets, lo, hi)
+            lo_buf = np.empty_like(x) if self._ema_smoothing else None
+            hi_buf = np.empty_like(x) if self._one_euro else None
+        
+        if self._one_euro:
+            _one_euro_update(
+                x, prev, self._dx_batch, lo_buf, hi_buf,
+                self._one_euro_min_cutoff, self._one_euro_beta, self._one_euro_d_alpha,
+                self._one_euro_inv_dt, self._one_euro_two_pi_dt
+            )
+        elif self._ema_smoothing:
+            np.multiply(x, self._alpha, out=x)
+            np.multiply(prev, self._one_minus_alpha, out=lo_buf)
+            np.add(x, lo_buf, out=x)
+        
+        # Output stays in [lo, hi] without a final clamp (see the note above
+        # the specialized smooth_inplace() bodies)
+        prev[:] = x
+        return x
     
     def reset(self):
         """
@@ -221,28 +586,54 @@ class ActionSmoother:
         
         Call this when starting a new episode.
         """
-        self._prev_steer = 0.0
-        self._prev_throttle = 0.0
-        self._prev_brake = 0.0
-        self._prev_clutch = 0.0
+        self._prev[:] = self._neutral
+        self._prev_batch = None
+        self._dx[:] = 0.0
+        self._dx_batch = None
         
-        logger.info("action_smoother_reset")
+        logger.debug("action_smoother_reset")
     
+    def prewarm(
+        self,
+        steer: float = 0.0,
+        throttle: float = 0.0,
+        brake: float = 0.0,
+        clutch: float = 0.0
+    ):
+        """
+        Seed the smoother state with a known steady-state action.
+        
+        The EMA is a single-pole IIR filter, y_t = a*x_t + (1 - a)*y_{t-1},
+        so after k steps the initial state still carries weight (1 - a)^k.
+        Starting from neutral, the first few actions of an episode are dragged
+        toward neutral. Setting the state to the action you expect to hold
+        (e.g. throttle=0.3 for a rolling start) removes that transient.
+        
+        Call after reset(). Values are clamped to the configured ranges.
+        """
+        np.clip([steer, throttle, brake, clutch], self._lo, self._hi, out=self._prev)
+        self._dx[:] = 0.0  # Steady state: not moving
+        
     def get_stats(self) -> dict:
         """
         Get smoothing statistics.
         
+        Only populated when the config has ``track_stats=True``.
+        
         Returns:
             Dict with average deltas and step count
+            ({'step_count': 0, 'tracking': False} if tracking is disabled)
         """
+        if not self._track_stats:
+            return {'step_count': 0, 'tracking': False}
         if self._step_count == 0:
             return {'step_count': 0}
         
         return {
             'step_count': self._step_count,
-            'avg_steer_delta': self._total_steer_delta / self._step_count,
-            'avg_throttle_delta': self._total_throttle_delta / self._step_count,
-            'avg_brake_delta': self._total_brake_delta / self._step_count,
+            'avg_steer_delta': float(self._total_delta[STEER]) / self._step_count,
+            'avg_throttle_delta': float(self._total_delta[THROTTLE]) / self._step_count,
+            'avg_brake_delta': float(self._total_delta[BRAKE]) / self._step_count,
             'config': {
                 'rate_limiting': self.config.enable_rate_limiting,
                 'ema_smoothing': self.config.enable_ema_smoothing,
@@ -251,56 +642,65 @@ class ActionSmoother:
         }
 
 
-# Preset configurations
+# Preset configurations (frozen, so one shared instance per preset is safe)
+
+CONSERVATIVE_CONFIG = SmoothingConfig(
+    max_steer_delta=0.10,
+    max_throttle_up=0.08,
+    max_throttle_down=0.20,
+    max_brake_up=0.25,
+    max_brake_down=0.08,
+    steer_alpha=0.5,
+    throttle_alpha=0.6,
+    brake_alpha=0.6
+)
+
+MODERATE_CONFIG = SmoothingConfig(
+    max_steer_delta=0.15,
+    max_throttle_up=0.10,
+    max_throttle_down=0.25,
+    max_brake_up=0.30,
+    max_brake_down=0.10,
+    steer_alpha=0.6,
+    throttle_alpha=0.7,
+    brake_alpha=0.7
+)
+
+AGGRESSIVE_CONFIG = SmoothingConfig(
+    max_steer_delta=0.20,
+    max_throttle_up=0.15,
+    max_throttle_down=0.30,
+    max_brake_up=0.40,
+    max_brake_down=0.15,
+    steer_alpha=0.7,
+    throttle_alpha=0.8,
+    brake_alpha=0.8
+)
+
+NO_SMOOTHING_CONFIG = SmoothingConfig(
+    enable_rate_limiting=False,
+    enable_ema_smoothing=False
+)
+
 
 def get_conservative_config() -> SmoothingConfig:
     """Conservative: Very smooth, human-like (good for initial training)."""
-    return SmoothingConfig(
-        max_steer_delta=0.10,
-        max_throttle_up=0.08,
-        max_throttle_down=0.20,
-        max_brake_up=0.25,
-        max_brake_down=0.08,
-        steer_alpha=0.5,
-        throttle_alpha=0.6,
-        brake_alpha=0.6
-    )
+    return CONSERVATIVE_CONFIG
 
 
 def get_moderate_config() -> SmoothingConfig:
     """Moderate: Balanced (recommended default)."""
-    return SmoothingConfig(
-        max_steer_delta=0.15,
-        max_throttle_up=0.10,
-        max_throttle_down=0.25,
-        max_brake_up=0.30,
-        max_brake_down=0.10,
-        steer_alpha=0.6,
-        throttle_alpha=0.7,
-        brake_alpha=0.7
-    )
+    return MODERATE_CONFIG
 
 
 def get_aggressive_config() -> SmoothingConfig:
     """Aggressive: More responsive (for advanced policies)."""
-    return SmoothingConfig(
-        max_steer_delta=0.20,
-        max_throttle_up=0.15,
-        max_throttle_down=0.30,
-        max_brake_up=0.40,
-        max_brake_down=0.15,
-        steer_alpha=0.7,
-        throttle_alpha=0.8,
-        brake_alpha=0.8
-    )
+    return AGGRESSIVE_CONFIG
 
 
 def get_no_smoothing_config() -> SmoothingConfig:
     """Disable all smoothing (hard clamps only)."""
-    return SmoothingConfig(
-        enable_rate_limiting=False,
-        enable_ema_smoothing=False
-    )
+    return NO_SMOOTHING_CONFIG
 
 
 # Demo
@@ -180,6 +180,7 @@ def test_telemetry(hz: int, duration: int):
     
     asm = ACSharedMemory()
     sleep_time = 1.0 / hz
+    display_every = max(1, hz // 5)  # Console output stays at <= 5 Hz
     packet_count = 0
     start_time = time.time()
     
@@ -197,20 +198,23 @@ def test_telemetry(hz: int, duration: int):
             p = asm.physics
             g = asm.graphics
             
-            # Display comprehensive telemetry
-            click.echo(
-                f"[{packet_count:05d}] "
-                f"Speed: {p.speedKmh:6.1f} km/h | "
-                f"RPM: {p.rpms:5d} | "
-                f"Gear: {p.gear} | "
-                f"Throttle: {p.gas:.2f} | "
-                f"Brake: {p.brake:.2f} | "
-                f"Steering: {p.steerAngle:+6.1f}° | "
-                f"Lap: {g.completedLaps} | "
-                f"TyresOut: {p.numberOfTyresOut}",
-                nl=False
-            )
-            click.echo("\r", nl=False)
+            # Display comprehensive telemetry. Formatting and the console
+            # write are the slowest part of the loop, and a terminal can't
+            # show more than a few updates a second anyway
+            if packet_count % display_every == 0:
+                click.echo(
+                    f"[{packet_count:05d}] "
+                    f"Speed: {p.speedKmh:6.1f} km/h | "
+                    f"RPM: {p.rpms:5d} | "
+                    f"Gear: {p.gear} | "
+                    f"Throttle: {p.gas:.2f} | "
+                    f"Brake: {p.brake:.2f} | "
+                    f"Steering: {p.steerAngle:+6.1f}° | "
+                    f"Lap: {g.completedLaps} | "
+                    f"TyresOut: {p.numberOfTyresOut}",
+                    nl=False
+                )
+                click.echo("\r", nl=False)
             
             time.sleep(sleep_time)
         
@@ -518,7 +522,19 @@ def reset(device_id: int, wait: int):
     help='Telemetry broadcast rate in Hz (default: 10)',
     type=int
 )
-def stream(host: str, port: int, rate: int):
+@click.option(
+    '--compression',
+    default='none',
+    help='permessage-deflate: none for LAN clients, deflate for slow links (default: none)',
+    type=click.Choice(['none', 'deflate'], case_sensitive=False)
+)
+@click.option(
+    '--batch-size',
+    default=1,
+    help='Packets per WebSocket frame; >1 sends lists of packets (default: 1)',
+    type=click.IntRange(min=1)
+)
+def stream(host: str, port: int, rate: int, compression: str, batch_size: int):
     """
     Stream telemetry over WebSocket (local development mode).
     
@@ -531,7 +547,7 @@ def stream(host: str, port: int, rate: int):
     Then connect with the example client:
         uv run examples/websocket_client.py
     """
-    import asyncio
+    from ac_bridge.runtime import run_loop
     from ac_bridge.websocket_server import TelemetryServer
     
     click.echo("\n" + "="*70)
@@ -539,13 +555,22 @@ def stream(host: str, port: int, rate: int):
     click.echo("="*70)
     click.echo(f"\nWebSocket server: ws://{host}:{port}")
     click.echo(f"Broadcast rate: {rate} Hz")
+    click.echo(f"Compression: {compression}")
+    if batch_size > 1:
+        click.echo(f"Batching: {batch_size} packets per frame")
     click.echo("\nWaiting for clients to connect...")
     click.echo("Press Ctrl+C to stop\n")
     
-    server = TelemetryServer(host=host, port=port, rate_hz=rate)
+    server = TelemetryServer(
+        host=host,
+        port=port,
+        rate_hz=rate,
+        compression=None if compression.lower() == 'none' else 'deflate',
+        batch_size=batch_size
+    )
     
     try:
-        asyncio.run(server.start())
+        run_loop(server.start())
     except KeyboardInterrupt:
         click.echo("\n\nStopping server...")
         server.stop()
@@ -570,7 +595,25 @@ def stream(host: str, port: int, rate: int):
     help='Seconds to wait before reconnecting (default: 5)',
     type=int
 )
-def cloud(uri: str, rate: int, reconnect_delay: int):
+@click.option(
+    '--batch-size',
+    default=1,
+    help='Packets per WebSocket frame; >1 sends JSON arrays (default: 1)',
+    type=click.IntRange(min=1)
+)
+@click.option(
+    '--format', 'packet_format',
+    default='json',
+    help='Packet format: json text frames, or compact binary records (default: json)',
+    type=click.Choice(['json', 'binary'], case_sensitive=False)
+)
+@click.option(
+    '--compression',
+    default='deflate',
+    help='permessage-deflate: deflate for internet links, none to send raw frames (default: deflate)',
+    type=click.Choice(['none', 'deflate'], case_sensitive=False)
+)
+def cloud(uri: str, rate: int, reconnect_delay: int, batch_size: int, packet_format: str, compression: str):
     """
     Stream telemetry to remote cloud server (e.g., EC2).
     
@@ -595,9 +638,20 @@ def cloud(uri: str, rate: int, reconnect_delay: int):
     click.echo(f"\nConnecting to: {uri}")
     click.echo(f"Send rate: {rate} Hz")
     click.echo(f"Auto-reconnect: {reconnect_delay}s delay")
+    if batch_size > 1:
+        click.echo(f"Batching: {batch_size} packets per frame")
+    click.echo(f"Packet format: {packet_format}")
+    click.echo(f"Compression: {compression}")
     click.echo("\nPress Ctrl+C to stop\n")
     
-    client = TelemetryClient(uri=uri, rate_hz=rate, reconnect_delay=reconnect_delay)
+    client = TelemetryClient(
+        uri=uri,
+        rate_hz=rate,
+        reconnect_delay=reconnect_delay,
+        batch_size=batch_size,
+        packet_format=packet_format.lower(),
+        compression=None if compression.lower() == 'none' else 'deflate'
+    )
     
     try:
         asyncio.run(client.start())
@@ -16,20 +16,226 @@ Usage in apex-seeker:
     bridge.reset()
 """
 
+import os
+import sys
 import time
+import ctypes
 import threading
+from dataclasses import dataclass
 from typing import Optional, Tuple
 import numpy as np
 import structlog
 
-from ac_bridge.timing import Ticker
-from ac_bridge.protocol import TelemetryFrame, ControlCommand
-from ac_bridge.telemetry.ac_native_memory import ACSharedMemory
+from ac_bridge.timing import Ticker, enable_high_resolution_timer, disable_high_resolution_timer
+from ac_bridge.protocol import ControlCommand
+from ac_bridge.telemetry.ac_native_memory import ACSharedMemory, SPageFilePhysics, SPageFileGraphic
 from ac_bridge.control.vjoy_controller import VJoyController
 from ac_bridge.action_smoother import ActionSmoother, SmoothingConfig, get_moderate_config
+from ac_bridge.telemetry import _kernels
 
 logger = structlog.get_logger()
 
+# Number of features written by ACBridgeLocal._read_and_process_telemetry()
+BASE_OBS_DIM = 15
+
+# Preallocated TelemetrySnapshot slots per ACBridgeLocal; a published frame is
+# rewritten in place FRAME_RING_SIZE ticks later
+FRAME_RING_SIZE = 4
+
+# Attempts ACBridgeLocal._read_latest() makes before giving up on a frame
+# that keeps being rewritten under it
+READ_RETRIES = 8
+
+# Per-feature normalization, applied as one multiply over the raw features
+OBS_SCALE = np.array([
+    1 / 300.0,                  # 0: speed (0-300 km/h → 0-1)
+    1 / 100.0,                  # 1: velocity x
+    1 / 100.0,                  # 2: velocity y
+    1 / 100.0,                  # 3: velocity z
+    1.0,                        # 4: throttle (already 0-1)
+    1.0,                        # 5: brake (already 0-1)
+    1 / 360.0,                  # 6: steering angle
+    1 / 10000.0,                # 7: RPM
+    1 / 6.0,                    # 8: gear
+    1 / 3.0,                    # 9: lateral g
+    1 / 3.0,                    # 10: longitudinal g
+    1 / 3.0,                    # 11: vertical g
+    1 / 8.0,                    # 12: wheel slip (sum of 4 → avg / 2)
+    1 / 4.0,                    # 13: tyres out (0-4 → 0-1)
+    1.0,                        # 14: any damage (binary)
+], dtype=np.float32)
+
+# Named view of the base features: obs[:BASE_OBS_DIM].view(OBS_DTYPE) is a
+# zero-copy 1-element record array, e.g. rec['speed'][0]
+OBS_DTYPE = np.dtype([
+    ('speed', np.float32),
+    ('velocity_x', np.float32),
+    ('velocity_y', np.float32),
+    ('velocity_z', np.float32),
+    ('throttle', np.float32),
+    ('brake', np.float32),
+    ('steer_angle', np.float32),
+    ('rpm', np.float32),
+    ('gear', np.float32),
+    ('lateral_g', np.float32),
+    ('longitudinal_g', np.float32),
+    ('vertical_g', np.float32),
+    ('wheel_slip', np.float32),
+    ('tyres_out', np.float32),
+    ('damaged', np.float32),
+])
+
+
+@dataclass(slots=True)
+class TelemetrySnapshot:
+    """
+    One telemetry tick as captured by ACBridgeLocal's polling thread.
+    
+    Holds copies of the AC physics/graphics pages (one memcpy each) instead
+    of a pre-built info dict; as_dict() builds the info dict only when a
+    consumer asks for it.
+    
+    ACBridgeLocal recycles its snapshots through a ring of FRAME_RING_SIZE
+    slots; seq is -1 while a slot is being rewritten. The bridge's read
+    methods hand out private copies.
+    
+    version is the slot's write counter (odd while the polling thread is
+    rewriting it). Unlike seq, it never repeats, even after the ticker is
+    reset.
+    """
+    
+    # Timing metadata (from Ticker)
+    seq: int
+    t_wall: float
+    dt: float
+    dt_actual: float
+    
+    # Normalized observation vector
+    obs: np.ndarray
+    
+    # Raw telemetry (copied out of shared memory)
+    physics: SPageFilePhysics
+    graphics: SPageFileGraphic
+    
+    # Seqlock counter of the ring slot (0 in copies)
+    version: int = 0
+    
+    def copy(self) -> "TelemetrySnapshot":
+        """Return a private copy (obs and both pages duplicated)."""
+        return TelemetrySnapshot(
+            seq=self.seq,
+            t_wall=self.t_wall,
+            dt=self.dt,
+            dt_actual=self.dt_actual,
+            obs=self.obs.copy(),
+            physics=SPageFilePhysics.from_buffer_copy(self.physics),
+            graphics=SPageFileGraphic.from_buffer_copy(self.graphics)
+        )
+    
+    def as_dict(self) -> dict:
+        """Build the info dict with all raw telemetry + timing metadata."""
+        p = self.physics
+        g = self.graphics
+        car_damage = list(p.carDamage)
+        tyre_wear = list(p.tyreWear)
+        damage_max = max(car_damage)  # Shared by both bodywork thresholds
+        
+        return {
+            # Core driving
+            'speed_kmh': p.speedKmh,
+            'rpm': p.rpms,
+            'gear': p.gear,
+            'throttle': p.gas,
+            'brake': p.brake,
+            'steer_angle': p.steerAngle,
+            
+            # Position & velocity
+            'position': list(g.carCoordinates),
+            'velocity': list(p.velocity),
+            'local_velocity': list(p.localVelocity),
+            'angular_velocity': list(p.localAngularVel),
+            
+            # G-forces
+            'acc_g': list(p.accG),
+            
+            # Wheel physics
+            'wheel_slip': list(p.wheelSlip),
+            'wheel_load': list(p.wheelLoad),
+            'wheel_pressure': list(p.wheelsPressure),
+            'wheel_angular_speed': list(p.wheelAngularSpeed),
+            
+            # Track limits & penalties
+            'tyres_out': p.numberOfTyresOut,
+            'is_valid_lap': p.numberOfTyresOut <= 2,  # ≤2 tyres out = valid
+            
+            # Lap & timing
+            'completed_laps': g.completedLaps,
+            'current_time': g.iCurrentTime,
+            'best_time': g.iBestTime,
+            'last_time': g.iLastTime,
+            'current_sector_index': g.currentSectorIndex,
+            'distance_traveled': g.distanceTraveled,
+            
+            # Damage
+            'car_damage': car_damage,
+            'bodywork_damaged': damage_max > 0.05,
+            'bodywork_critical': damage_max > 0.50,
+            'tyre_wear': tyre_wear,
+            'tyre_damaged': max(tyre_wear) > 0.80,
+            
+            # Environment
+            'surface_grip': g.surfaceGrip,
+            'air_temp': p.airTemp,
+            'road_temp': p.roadTemp,
+            'is_in_pit_lane': bool(g.isInPitLane),
+            
+            # Session
+            'session_type': g.session,
+            'status': g.status,
+            
+            # Packet ID (for debugging)
+            'packet_id': p.packetId,
+            
+            # Timing metadata
+            'seq': self.seq,
+            't_wall': self.t_wall,
+            'dt': self.dt,
+            'dt_actual': self.dt_actual,
+        }
+
+
+def _configure_current_thread(core: Optional[int], priority: Optional[int]) -> None:
+    """
+    Pin the calling thread to a CPU core and/or raise its priority.
+    
+    Failures (e.g. no permission for SCHED_FIFO) are logged, not raised:
+    the thread still works, just with default scheduling.
+    """
+    try:
+        if sys.platform == "win32":
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetCurrentThread()
+            if core is not None and not kernel32.SetThreadAffinityMask(handle, 1 << core):
+                raise OSError(f"SetThreadAffinityMask failed for core {core}")
+            if priority is not None and not kernel32.SetThreadPriority(handle, priority):
+                raise OSError(f"SetThreadPriority failed for priority {priority}")
+        else:
+            # pid 0 = calling thread on Linux
+            if core is not None:
+                os.sched_setaffinity(0, {core})
+            if priority is not None:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        
+        logger.info("thread_scheduling_configured", core=core, priority=priority)
+    
+    except (OSError, AttributeError) as e:
+        logger.warning(
+            "thread_scheduling_failed",
+            core=core,
+            priority=priority,
+            error=str(e)
+        )
+
 
 class ACBridgeLocal:
     """
@@ -59,7 +265,9 @@ class ACBridgeLocal:
         controller: str = "vjoy",
         device_id: int = 1,
         obs_dim: int = 15,
-        smoothing_config: SmoothingConfig = None
+        smoothing_config: SmoothingConfig = None,
+        affinity_core: Optional[int] = None,
+        priority: Optional[int] = None
     ):
         """
         Initialize bridge.
@@ -72,13 +280,42 @@ class ACBridgeLocal:
             obs_dim: Observation vector dimension (default: 15)
             smoothing_config: Action smoothing configuration (default: moderate)
                              Set to None to disable smoothing
+            affinity_core: Pin the telemetry thread to this CPU core (default: no pinning)
+            priority: Telemetry thread priority, in the platform's native units:
+                      SetThreadPriority level on Windows (e.g. 15 = time critical),
+                      SCHED_FIFO priority (1-99) on Linux (default: unchanged)
         """
         self.telemetry_hz = telemetry_hz
         self.control_hz = control_hz
         self.obs_dim = obs_dim
+        self.affinity_core = affinity_core
+        self.priority = priority
+        
+        # Reusable observation buffer, filled in place every telemetry tick.
+        # Sized to hold all base features; extra obs_dim slots stay zero.
+        if obs_dim != BASE_OBS_DIM:
+            logger.warning(
+                "obs_dim_mismatch",
+                expected=obs_dim,
+                actual=BASE_OBS_DIM,
+                msg="Observation will be zero-padded or truncated"
+            )
+        self._obs_buf = np.zeros(max(obs_dim, BASE_OBS_DIM), dtype=np.float32)
         
         # Initialize hardware interfaces
         self.telemetry_reader = ACSharedMemory()
+        
+        # Staging copy of the physics page: each tick is memmoved here so the
+        # obs gather can use persistent zero-copy ndarray views
+        self._physics_buf = SPageFilePhysics()
+        self._physics_src = ctypes.addressof(self.telemetry_reader.physics)
+        self._physics_dst = ctypes.addressof(self._physics_buf)
+        self._physics_size = ctypes.sizeof(SPageFilePhysics)
+        self._graphics_src = ctypes.addressof(self.telemetry_reader.graphics)
+        self._graphics_size = ctypes.sizeof(SPageFileGraphic)
+        # Whole-page float32/int32 views for the obs gather (_kernels.fill_obs)
+        self._v_page_f = np.frombuffer(self._physics_buf, dtype=np.float32)
+        self._v_page_i = self._v_page_f.view(np.int32)
         self.controller = VJoyController(device_id=device_id) if controller == "vjoy" else None
         
         # Action smoothing (use moderate config by default)
@@ -89,14 +326,35 @@ class ACBridgeLocal:
         # Timing
         self.telemetry_ticker = Ticker(hz=telemetry_hz)
         
-        # Thread-safe cache for latest telemetry
-        self._latest_frame: Optional[TelemetryFrame] = None
-        self._frame_lock = threading.Lock()
+        # Preallocated frame slots, filled in place by the polling thread so
+        # the hot path allocates nothing but the info dict on demand
+        self._ring = [
+            TelemetrySnapshot(
+                seq=-1,
+                t_wall=0.0,
+                dt=0.0,
+                dt_actual=0.0,
+                obs=np.zeros(obs_dim, dtype=np.float32),
+                physics=SPageFilePhysics(),
+                graphics=SPageFileGraphic()
+            )
+            for _ in range(FRAME_RING_SIZE)
+        ]
+        self._ring_head = 0
+        
+        # Latest telemetry, published by the polling thread with a single
+        # reference store (no lock). The slot's version is bumped to odd before
+        # it is rewritten and back to even after, so readers check version
+        # around their copy and retry if it changed (seqlock; see
+        # _read_latest()).
+        self._latest_frame: Optional[TelemetrySnapshot] = None
+        self._first_frame = threading.Event()  # Set on the first frame after connect()
         
         # Background thread
         self._telemetry_thread: Optional[threading.Thread] = None
         self._running = False
         self._connected = False
+        self._high_res_timer = False
         
         logger.info(
             "bridge_initialized",
@@ -118,6 +376,8 @@ class ACBridgeLocal:
             return
         
         self._running = True
+        self._first_frame.clear()  # Wait for this connection's first frame
+        self._high_res_timer = enable_high_resolution_timer()
         self._telemetry_thread = threading.Thread(
             target=self._poll_telemetry_loop,
             daemon=True,
@@ -127,12 +387,7 @@ class ACBridgeLocal:
         self._connected = True
         
         # Wait for first frame
-        timeout = 5.0
-        start = time.time()
-        while self._latest_frame is None and (time.time() - start) < timeout:
-            time.sleep(0.01)
-        
-        if self._latest_frame is None:
+        if not self._first_frame.wait(timeout=5.0):
             logger.warning("no_initial_frame", msg="AC might not be running")
         else:
             logger.info("bridge_connected", first_frame_seq=self._latest_frame.seq)
@@ -151,6 +406,10 @@ class ACBridgeLocal:
         if self._telemetry_thread and self._telemetry_thread.is_alive():
             self._telemetry_thread.join(timeout=2.0)
         
+        if self._high_res_timer:
+            disable_high_resolution_timer()
+            self._high_res_timer = False
+        
         if self.controller:
             self.controller.reset()
             self.controller.close()
@@ -178,13 +437,75 @@ class ACBridgeLocal:
         Raises:
             RuntimeError: If no telemetry available (AC not running or not connected)
         """
-        with self._frame_lock:
-            if self._latest_frame is None:
+        return self._read_latest(lambda frame: (frame.obs.copy(), frame.as_dict()))
+    
+    def latest_obs_into(self, out: np.ndarray) -> int:
+        """
+        Copy the most recent observation into ``out`` without allocating.
+        
+        For agents that poll faster than the control rate and only need obs.
+        There is deliberately no zero-copy variant: ring slots are rewritten
+        FRAME_RING_SIZE ticks after publication (~67 ms at 60 Hz), sooner
+        than a typical 100 ms control step ends.
+        
+        Args:
+            out: float32 array of shape (obs_dim,), overwritten in place
+        
+        Returns:
+            seq of the frame the observation came from
+        
+        Raises:
+            RuntimeError: If no telemetry available (AC not running or not connected)
+        """
+        def read(frame):
+            out[:] = frame.obs
+            return frame.seq
+        
+        return self._read_latest(read)
+    
+    def latest_frame(self) -> TelemetrySnapshot:
+        """
+        Get the most recent telemetry snapshot without building info.
+        
+        For consumers that only need obs (or only some raw fields): the
+        info dict costs ~40 conversions and is only built on frame.as_dict().
+        The returned snapshot is a private copy.
+        
+        Raises:
+            RuntimeError: If no telemetry available (AC not running or not connected)
+        """
+        return self._read_latest(TelemetrySnapshot.copy)
+    
+    def _read_latest(self, read):
+        """
+        Apply ``read`` to the latest frame, retrying if it was recycled meanwhile.
+        
+        The polling thread may start rewriting the slot while ``read`` runs;
+        an even version that is unchanged afterwards means the result is
+        consistent. After a failed attempt the GIL is released (sleep(0)) so
+        the polling thread can finish the slot it is writing.
+        
+        Raises:
+            RuntimeError: If no telemetry is available, or no consistent read
+                succeeded within READ_RETRIES attempts
+        """
+        for _ in range(READ_RETRIES):
+            frame = self._latest_frame  # Read the reference once
+            if frame is None:
                 raise RuntimeError(
                     "No telemetry available. Is AC running? Did you call connect()?"
                 )
             
-            return self._latest_frame.obs.copy(), self._latest_frame.info.copy()
+            version = frame.version
+            if not version & 1:
+                result = read(frame)
+                if frame.version == version:
+                    return result
+            time.sleep(0)
+        
+        raise RuntimeError(
+            f"Telemetry frame was rewritten during {READ_RETRIES} consecutive reads"
+        )
     
     def apply_action(
         self,
@@ -293,6 +614,10 @@ class ACBridgeLocal:
         """
         logger.info("telemetry_thread_started", hz=self.telemetry_hz)
         
+        if self.affinity_core is not None or self.priority is not None:
+            _configure_current_thread(self.affinity_core, self.priority)
+        
+        first_published = False
         try:
             for seq, t_wall, dt, dt_actual in self.telemetry_ticker:
                 if not self._running:
@@ -304,31 +629,28 @@ class ACBridgeLocal:
                     time.sleep(dt / 2)  # Sleep a bit to avoid busy loop
                     continue
                 
-                # Read and process telemetry
+                # Read and process telemetry into the oldest ring slot
+                # (info dict is built lazily by latest_obs())
                 try:
-                    obs, info = self._read_and_process_telemetry()
+                    frame = self._ring[self._ring_head % FRAME_RING_SIZE]
+                    # Odd: readers still holding this slot will retry (|= keeps
+                    # it odd if the last rewrite of this slot raised)
+                    frame.version |= 1
+                    frame.seq = -1
                     
-                    # Add timing metadata
-                    info.update({
-                        'seq': seq,
-                        't_wall': t_wall,
-                        'dt': dt,
-                        'dt_actual': dt_actual
-                    })
+                    self._read_and_process_telemetry(frame)
+                    frame.t_wall = t_wall
+                    frame.dt = dt
+                    frame.dt_actual = dt_actual
+                    frame.seq = seq
+                    frame.version += 1  # Even: slot is consistent again
                     
-                    # Create frame
-                    frame = TelemetryFrame(
-                        seq=seq,
-                        t_wall=t_wall,
-                        dt=dt,
-                        dt_actual=dt_actual,
-                        obs=obs,
-                        info=info
-                    )
-                    
-                    # Update cache (thread-safe)
-                    with self._frame_lock:
-                        self._latest_frame = frame
+                    # Publish (atomic reference swap, see __init__)
+                    self._latest_frame = frame
+                    self._ring_head += 1
+                    if not first_published:
+                        first_published = True
+                        self._first_frame.set()
                 
                 except Exception as e:
                     logger.error("telemetry_read_error", error=str(e))
@@ -339,127 +661,35 @@ class ACBridgeLocal:
         finally:
             logger.info("telemetry_thread_stopped")
     
-    def _read_and_process_telemetry(self) -> Tuple[np.ndarray, dict]:
+    def _read_and_process_telemetry(self, frame: TelemetrySnapshot) -> None:
         """
         Read AC telemetry and convert to standardized observation.
         
         This defines the observation space that apex-seeker will see.
-        Customize this based on your RL task.
+        Customize this based on your RL task (and TelemetrySnapshot.as_dict()
+        for the info fields).
         
-        Returns:
-            (obs, info) tuple where:
-                obs: Normalized observation vector
-                info: Raw telemetry dict
+        Args:
+            frame: Ring slot to fill in place: frame.obs gets the normalized
+                observation, frame.physics/graphics copies of the AC shared
+                memory pages, so obs and info come from the same instant
         """
-        p = self.telemetry_reader.physics
-        g = self.telemetry_reader.graphics
-        s = self.telemetry_reader.static
-        
-        # Build standardized observation vector (normalized)
-        # Customize this for your specific RL task!
-        obs = np.array([
-            # Velocity (normalized)
-            p.speedKmh / 300.0,                    # 0: speed (0-300 km/h → 0-1)
-            p.velocity[0] / 100.0,                 # 1: velocity x
-            p.velocity[1] / 100.0,                 # 2: velocity y  
-            p.velocity[2] / 100.0,                 # 3: velocity z
-            
-            # Control inputs (already 0-1)
-            p.gas,                                  # 4: throttle
-            p.brake,                                # 5: brake
-            p.steerAngle / 360.0,                  # 6: steering angle
-            
-            # Engine
-            p.rpms / 10000.0,                      # 7: RPM
-            p.gear / 6.0,                          # 8: gear
-            
-            # G-forces
-            p.accG[0] / 3.0,                       # 9: lateral g
-            p.accG[1] / 3.0,                       # 10: longitudinal g
-            p.accG[2] / 3.0,                       # 11: vertical g
-            
-            # Wheel slip (average)
-            np.mean(p.wheelSlip) / 2.0,            # 12: avg wheel slip
-            
-            # Track position
-            float(p.numberOfTyresOut) / 4.0,       # 13: tyres out (0-4 → 0-1)
-            
-            # Damage indicator
-            float(np.any(np.array(p.carDamage) > 0.05)),  # 14: any damage (binary)
-        ], dtype=np.float32)
+        ctypes.memmove(self._physics_dst, self._physics_src, self._physics_size)
+        ctypes.memmove(
+            ctypes.addressof(frame.graphics), self._graphics_src, self._graphics_size
+        )
         
-        # Ensure correct dimension
-        if obs.shape[0] != self.obs_dim:
-            logger.warning(
-                "obs_dim_mismatch",
-                expected=self.obs_dim,
-                actual=obs.shape[0]
-            )
-            # Pad or truncate to match
-            if obs.shape[0] < self.obs_dim:
-                obs = np.pad(obs, (0, self.obs_dim - obs.shape[0]))
-            else:
-                obs = obs[:self.obs_dim]
-        
-        # Build info dict with all raw telemetry
-        info = {
-            # Core driving
-            'speed_kmh': float(p.speedKmh),
-            'rpm': int(p.rpms),
-            'gear': int(p.gear),
-            'throttle': float(p.gas),
-            'brake': float(p.brake),
-            'steer_angle': float(p.steerAngle),
-            
-            # Position & velocity
-            'position': [float(g.carCoordinates[0]), float(g.carCoordinates[1]), float(g.carCoordinates[2])],
-            'velocity': [float(p.velocity[0]), float(p.velocity[1]), float(p.velocity[2])],
-            'local_velocity': [float(p.localVelocity[0]), float(p.localVelocity[1]), float(p.localVelocity[2])],
-            'angular_velocity': [float(p.localAngularVel[0]), float(p.localAngularVel[1]), float(p.localAngularVel[2])],
-            
-            # G-forces
-            'acc_g': [float(p.accG[0]), float(p.accG[1]), float(p.accG[2])],
-            
-            # Wheel physics
-            'wheel_slip': [float(s) for s in p.wheelSlip],
-            'wheel_load': [float(l) for l in p.wheelLoad],
-            'wheel_pressure': [float(pr) for pr in p.wheelsPressure],
-            'wheel_angular_speed': [float(s) for s in p.wheelAngularSpeed],
-            
-            # Track limits & penalties
-            'tyres_out': int(p.numberOfTyresOut),
-            'is_valid_lap': int(p.numberOfTyresOut) <= 2,  # ≤2 tyres out = valid
-            
-            # Lap & timing
-            'completed_laps': int(g.completedLaps),
-            'current_time': int(g.iCurrentTime),
-            'best_time': int(g.iBestTime),
-            'last_time': int(g.iLastTime),
-            'current_sector_index': int(g.currentSectorIndex),
-            'distance_traveled': float(g.distanceTraveled),
-            
-            # Damage
-            'car_damage': [float(d) for d in p.carDamage],
-            'bodywork_damaged': bool(np.any(np.array(p.carDamage) > 0.05)),
-            'bodywork_critical': bool(np.any(np.array(p.carDamage) > 0.50)),
-            'tyre_wear': [float(w) for w in p.tyreWear],
-            'tyre_damaged': bool(np.any(np.array(p.tyreWear) > 0.80)),
-            
-            # Environment
-            'surface_grip': float(g.surfaceGrip),
-            'air_temp': float(p.airTemp),
-            'road_temp': float(p.roadTemp),
-            'is_in_pit_lane': bool(g.isInPitLane),
-            
-            # Session
-            'session_type': int(g.session),
-            'status': int(g.status),
-            
-            # Packet ID (for debugging)
-            'packet_id': int(p.packetId),
-        }
+        # Gather + normalize over the staged page. The layout lives in
+        # ac_bridge/telemetry/_kernels.py (OBS_FIELDS); customize it (and
+        # OBS_SCALE) for your specific RL task!
+        b = self._obs_buf
+        _kernels.fill_obs(b, self._v_page_f, self._v_page_i, OBS_SCALE)
+        
+        # Copy into the slot (also pads/truncates to obs_dim)
+        frame.obs[:] = b[:self.obs_dim]
         
-        return obs, info
+        # The staging buffer is reused next tick; the slot keeps its own copy
+        ctypes.memmove(ctypes.addressof(frame.physics), self._physics_dst, self._physics_size)
 
 
 class ACBridgeWSClient:
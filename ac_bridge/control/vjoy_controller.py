@@ -10,6 +10,8 @@ import structlog
 import pyvjoy
 from pyvjoy.exceptions import vJoyException
 
+from ac_bridge.timing import precise_sleep
+
 logger = structlog.get_logger()
 
 
@@ -18,8 +20,8 @@ class VJoyController:
     Fast vJoy controller for AC with minimal latency.
     
     Features:
-    - Value caching (only update changed values)
-    - Batch axis updates
+    - Value caching (only update axes whose quantized value changed)
+    - Batch axis updates (one UpdateVJD call per set_controls)
     - Direct vJoy API calls (no abstraction overhead)
     - Performance monitoring
     
@@ -33,11 +35,28 @@ class VJoyController:
     - 1-7: Gears (sequential up/down via button presses)
     """
     
+    __slots__ = (
+        'device_id', 'device',
+        '_c_throttle', '_c_brake', '_c_clutch', '_c_steering', '_c_gear',
+        '_update_count', '_start_time',
+    )
+    
     # vJoy axis ranges (0x1 to 0x8000)
     AXIS_MIN = 0x1
     AXIS_MAX = 0x8000
     AXIS_CENTER = 0x4000
     
+    # Precomputed _float_to_axis() coefficients
+    _FULL_RANGE = AXIS_MAX - AXIS_MIN
+    _HALF_RANGE = _FULL_RANGE * 0.5
+    _SYM_OFFSET = AXIS_MIN + _HALF_RANGE  # Axis value for 0.0 in [-1, 1] mode
+    
+    # set_controls() change-mask bits
+    _STEERING_BIT = 1
+    _THROTTLE_BIT = 2
+    _BRAKE_BIT = 4
+    _CLUTCH_BIT = 8
+    
     def __init__(self, device_id: int = 1):
         """
         Initialize vJoy device.
@@ -57,14 +76,14 @@ class VJoyController:
                 "Make sure vJoy is installed and device is configured."
             ) from e
         
-        # Value cache to avoid redundant updates
-        self._cache = {
-            'throttle': None,
-            'brake': None,
-            'clutch': None,
-            'steering': None,
-            'gear': None
-        }
+        # Cache of the axis values last sent (quantized ints, so inputs that
+        # differ by less than one axis step don't trigger an update). Slots,
+        # not a dict: these are compared on every set_controls call.
+        self._c_throttle = None
+        self._c_brake = None
+        self._c_clutch = None
+        self._c_steering = None
+        self._c_gear = None
         
         # Performance tracking
         self._update_count = 0
@@ -80,14 +99,20 @@ class VJoyController:
         self.device.set_axis(pyvjoy.HID_USAGE_Z, self.AXIS_MIN)     # Brake off
         self.device.set_axis(pyvjoy.HID_USAGE_RZ, self.AXIS_MIN)    # Clutch off
         
+        # Mirror into the position struct (set_controls only rewrites
+        # the axes that changed)
+        data = self.device.data
+        data.wAxisX = self.AXIS_CENTER
+        data.wAxisY = self.AXIS_MIN
+        data.wAxisZ = self.AXIS_MIN
+        data.wAxisZRot = self.AXIS_MIN
+        
         # Reset cache
-        self._cache = {
-            'throttle': 0.0,
-            'brake': 0.0,
-            'clutch': 0.0,
-            'steering': 0.0,
-            'gear': 1
-        }
+        self._c_throttle = self.AXIS_MIN
+        self._c_brake = self.AXIS_MIN
+        self._c_clutch = self.AXIS_MIN
+        self._c_steering = self.AXIS_CENTER
+        self._c_gear = 1
         
         logger.info("vjoy_reset", device_id=self.device_id)
     
@@ -131,6 +156,34 @@ class VJoyController:
                 )
                 return False
     
+    def _safe_update(self) -> bool:
+        """
+        Submit device.data (all axes at once) via UpdateVJD, retrying once.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.device.update():
+            return True
+        
+        logger.warning(
+            "vjoy_update_error",
+            device_id=self.device_id,
+            attempt="first"
+        )
+        
+        time.sleep(0.01)  # Brief pause
+        if self.device.update():
+            logger.info("vjoy_update_recovered")
+            return True
+        
+        logger.error(
+            "vjoy_update_failed",
+            device_id=self.device_id,
+            msg="vJoy device may be in error state. Try restarting vJoy or AC."
+        )
+        return False
+    
     def _float_to_axis(self, value: float, center_zero: bool = False) -> int:
         """
         Convert float value to vJoy axis value.
@@ -141,15 +194,20 @@ class VJoyController:
         
         Returns:
             vJoy axis value (0x1 to 0x8000)
+        
+        NaN maps to the neutral value (centered steering, released pedal);
+        +/-inf clamps like any other out-of-range value.
         """
+        if value != value:
+            value = 0.0  # NaN (e.g. from a diverged policy)
         if center_zero:
             # -1.0 to 1.0 -> AXIS_MIN to AXIS_MAX
-            value = max(-1.0, min(1.0, value))
-            return int(self.AXIS_MIN + (value + 1.0) * 0.5 * (self.AXIS_MAX - self.AXIS_MIN))
+            value = -1.0 if value < -1.0 else (1.0 if value > 1.0 else value)
+            return int(self._SYM_OFFSET + value * self._HALF_RANGE)
         else:
             # 0.0 to 1.0 -> AXIS_MIN to AXIS_MAX
-            value = max(0.0, min(1.0, value))
-            return int(self.AXIS_MIN + value * (self.AXIS_MAX - self.AXIS_MIN))
+            value = 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+            return int(self.AXIS_MIN + value * self._FULL_RANGE)
     
     def set_throttle(self, value: float):
         """
@@ -158,12 +216,13 @@ class VJoyController:
         Args:
             value: Throttle 0.0 (off) to 1.0 (full)
         """
-        if self._cache['throttle'] == value:
+        axis_value = self._float_to_axis(value)
+        if self._c_throttle == axis_value:
             return
         
-        axis_value = self._float_to_axis(value)
         if self._safe_set_axis(pyvjoy.HID_USAGE_Y, axis_value, "throttle"):
-            self._cache['throttle'] = value
+            self.device.data.wAxisY = axis_value  # Keep set_controls() in sync
+            self._c_throttle = axis_value
             self._update_count += 1
     
     def set_brake(self, value: float):
@@ -173,12 +232,13 @@ class VJoyController:
         Args:
             value: Brake 0.0 (off) to 1.0 (full)
         """
-        if self._cache['brake'] == value:
+        axis_value = self._float_to_axis(value)
+        if self._c_brake == axis_value:
             return
         
-        axis_value = self._float_to_axis(value)
         if self._safe_set_axis(pyvjoy.HID_USAGE_Z, axis_value, "brake"):
-            self._cache['brake'] = value
+            self.device.data.wAxisZ = axis_value  # Keep set_controls() in sync
+            self._c_brake = axis_value
             self._update_count += 1
     
     def set_clutch(self, value: float):
@@ -188,12 +248,13 @@ class VJoyController:
         Args:
             value: Clutch 0.0 (released) to 1.0 (pressed)
         """
-        if self._cache['clutch'] == value:
+        axis_value = self._float_to_axis(value)
+        if self._c_clutch == axis_value:
             return
         
-        axis_value = self._float_to_axis(value)
         if self._safe_set_axis(pyvjoy.HID_USAGE_RZ, axis_value, "clutch"):
-            self._cache['clutch'] = value
+            self.device.data.wAxisZRot = axis_value  # Keep set_controls() in sync
+            self._c_clutch = axis_value
             self._update_count += 1
     
     def set_steering(self, value: float):
@@ -203,12 +264,13 @@ class VJoyController:
         Args:
             value: Steering -1.0 (full left) to 1.0 (full right), 0.0 (center)
         """
-        if self._cache['steering'] == value:
+        axis_value = self._float_to_axis(value, center_zero=True)
+        if self._c_steering == axis_value:
             return
         
-        axis_value = self._float_to_axis(value, center_zero=True)
         if self._safe_set_axis(pyvjoy.HID_USAGE_X, axis_value, "steering"):
-            self._cache['steering'] = value
+            self.device.data.wAxisX = axis_value  # Keep set_controls() in sync
+            self._c_steering = axis_value
             self._update_count += 1
     
     def set_gear(self, gear: int):
@@ -223,27 +285,27 @@ class VJoyController:
         - Button 1: Gear up
         - Button 2: Gear down
         """
-        if self._cache['gear'] == gear:
+        if self._c_gear == gear:
             return
         
-        current_gear = self._cache['gear'] or 1
+        current_gear = self._c_gear or 1
         
         if gear > current_gear:
             # Shift up
             for _ in range(gear - current_gear):
                 self.device.set_button(1, 1)
-                time.sleep(0.001)  # 1ms button press
+                precise_sleep(0.001)  # 1ms button press
                 self.device.set_button(1, 0)
-                time.sleep(0.001)
+                precise_sleep(0.001)
         elif gear < current_gear:
             # Shift down
             for _ in range(current_gear - gear):
                 self.device.set_button(2, 1)
-                time.sleep(0.001)
+                precise_sleep(0.001)
                 self.device.set_button(2, 0)
-                time.sleep(0.001)
+                precise_sleep(0.001)
         
-        self._cache['gear'] = gear
+        self._c_gear = gear
         self._update_count += 1
     
     def restart_session(self):
@@ -254,7 +316,7 @@ class VJoyController:
         "Restart Session" in AC's controls.
         """
         self.device.set_button(7, 1)
-        time.sleep(0.05)  # 50ms button press
+        precise_sleep(0.05)  # 50ms button press
         self.device.set_button(7, 0)
         logger.info("restart_session_triggered")
     
@@ -273,7 +335,7 @@ class VJoyController:
         - Button 8: Restart session
         """
         self.device.set_button(button, 1)
-        time.sleep(duration)
+        precise_sleep(duration)
         self.device.set_button(button, 0)
         logger.debug("button_pressed", button=button, duration=duration)
     
@@ -281,8 +343,12 @@ class VJoyController:
         """
         Batch update all controls for minimum latency.
         
-        This is the most efficient way to update multiple axes at once.
-        Includes error handling for vJoy exceptions with auto-retry.
+        Axes that changed are rewritten in the device's position struct, which
+        is then submitted (all four axes) with a single UpdateVJD call, so AC
+        always sees a consistent snapshot. Retries once on failure.
+        
+        Note: UpdateVJD also submits the struct's button state, so don't hold
+        a button (press_button) from another thread while calling this.
         
         Args:
             throttle: 0.0 to 1.0
@@ -290,26 +356,48 @@ class VJoyController:
             steering: -1.0 to 1.0
             clutch: 0.0 to 1.0 (default: 0.0)
         """
-        # Only update changed values
-        if self._cache['throttle'] != throttle:
-            if self._safe_set_axis(pyvjoy.HID_USAGE_Y, self._float_to_axis(throttle), "throttle"):
-                self._cache['throttle'] = throttle
-                self._update_count += 1
-        
-        if self._cache['brake'] != brake:
-            if self._safe_set_axis(pyvjoy.HID_USAGE_Z, self._float_to_axis(brake), "brake"):
-                self._cache['brake'] = brake
-                self._update_count += 1
-        
-        if self._cache['steering'] != steering:
-            if self._safe_set_axis(pyvjoy.HID_USAGE_X, self._float_to_axis(steering, center_zero=True), "steering"):
-                self._cache['steering'] = steering
-                self._update_count += 1
-        
-        if self._cache['clutch'] != clutch:
-            if self._safe_set_axis(pyvjoy.HID_USAGE_RZ, self._float_to_axis(clutch), "clutch"):
-                self._cache['clutch'] = clutch
-                self._update_count += 1
+        x = self._float_to_axis(steering, center_zero=True)
+        y = self._float_to_axis(throttle)
+        z = self._float_to_axis(brake)
+        rz = self._float_to_axis(clutch)
+        
+        # Mask of changed axes (after quantization); only submit if something changed
+        changed = 0
+        if x != self._c_steering:
+            changed |= self._STEERING_BIT
+        if y != self._c_throttle:
+            changed |= self._THROTTLE_BIT
+        if z != self._c_brake:
+            changed |= self._BRAKE_BIT
+        if rz != self._c_clutch:
+            changed |= self._CLUTCH_BIT
+        if not changed:
+            return
+        
+        data = self.device.data
+        if changed & self._STEERING_BIT:
+            data.wAxisX = x
+        if changed & self._THROTTLE_BIT:
+            data.wAxisY = y
+        if changed & self._BRAKE_BIT:
+            data.wAxisZ = z
+        if changed & self._CLUTCH_BIT:
+            data.wAxisZRot = rz
+        
+        if self._safe_update():
+            self._c_throttle = y
+            self._c_brake = z
+            self._c_steering = x
+            self._c_clutch = rz
+            self._update_count += 1
+        else:
+            # device.data now holds values the device never got, so the cache
+            # no longer describes either side: drop it, and the next call
+            # rewrites (and submits) every axis
+            self._c_throttle = None
+            self._c_brake = None
+            self._c_steering = None
+            self._c_clutch = None
     
     def get_stats(self):
         """
@@ -0,0 +1,62 @@
+"""
+Process plumbing shared by the CLI and the example servers.
+
+- run_loop: asyncio.run, or uvloop's when it is installed
+- setup_logging: stdlib logging through a queue, off the event loop
+- close_on_signals: close a websockets server on SIGINT/SIGTERM
+"""
+
+import asyncio
+import logging
+import logging.handlers
+import queue
+import signal
+import structlog
+
+logger = structlog.get_logger()
+
+# Run on uvloop when it's installed (POSIX only; Windows keeps the default loop)
+try:
+    from uvloop import run as run_loop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    run_loop = asyncio.run
+    UVLOOP_AVAILABLE = False
+    logger.debug("uvloop_not_available",
+                 msg="Servers will use the default asyncio loop. Install with: uv add uvloop")
+
+
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route stdlib log records through a queue to a listener thread.
+    
+    The handler only enqueues the record, so the event loop never blocks
+    on console I/O. Stop the returned listener to flush it on exit.
+    """
+    log_queue = queue.SimpleQueue()
+    # QueueHandler.prepare() formats the message, so the format goes here;
+    # the console handler just writes the finished line
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s", "%H:%M:%S"))
+    logging.basicConfig(level=level, handlers=[handler])
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    return listener
+
+
+def close_on_signals(server) -> None:
+    """
+    Call ``server.close()`` on SIGINT/SIGTERM.
+    
+    For a websockets server this stops accepting, sends every client a
+    1001 close, and lets the handlers finish, so ``await
+    server.wait_closed()`` returns cleanly. The Windows Proactor loop has
+    no signal handlers; Ctrl+C raises KeyboardInterrupt there instead.
+    Must be called from inside the running loop.
+    """
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, server.close)
+        except NotImplementedError:
+            pass
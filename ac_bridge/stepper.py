@@ -17,6 +17,10 @@ from ac_bridge.client import ACBridgeLocal
 
 logger = structlog.get_logger()
 
+# Valid range of each action component: steer, throttle, brake, clutch
+_ACTION_LO = np.array([-1.0, 0.0, 0.0, 0.0])
+_ACTION_HI = np.array([1.0, 1.0, 1.0, 1.0])
+
 
 class RealTimeStepper:
     """
@@ -46,7 +50,8 @@ class RealTimeStepper:
         self,
         bridge: ACBridgeLocal,
         control_hz: int = 10,
-        verify_action_applied: bool = False
+        verify_action_applied: bool = False,
+        telemetry_info: bool = True
     ):
         """
         Initialize stepper.
@@ -56,10 +61,14 @@ class RealTimeStepper:
             control_hz: Control rate in Hz (default: 10 Hz = 0.1s steps)
             verify_action_applied: If True, verify action was applied by comparing
                                    with telemetry (adds latency, for debugging only)
+            telemetry_info: If False, step() skips building the raw telemetry
+                            part of info (~40 fields) and returns only the step
+                            metadata. For agents that learn from obs alone.
         """
         self.bridge = bridge
         self.control_hz = control_hz
         self.verify_action_applied = verify_action_applied
+        self.telemetry_info = telemetry_info
         
         # Ticker for step timing
         self.ticker = Ticker(hz=control_hz)
@@ -108,16 +117,14 @@ class RealTimeStepper:
         brake = float(action[2])
         clutch = float(action[3]) if len(action) > 3 else 0.0
         
-        # Validate action ranges
-        if not (-1.0 <= steer <= 1.0):
-            logger.warning("action_out_of_range", component="steer", value=steer)
-            steer = np.clip(steer, -1.0, 1.0)
-        if not (0.0 <= throttle <= 1.0):
-            logger.warning("action_out_of_range", component="throttle", value=throttle)
-            throttle = np.clip(throttle, 0.0, 1.0)
-        if not (0.0 <= brake <= 1.0):
-            logger.warning("action_out_of_range", component="brake", value=brake)
-            brake = np.clip(brake, 0.0, 1.0)
+        # Validate action ranges: one combined check on the (common) in-range
+        # path; only out-of-range actions pay for the clip
+        if not (-1.0 <= steer <= 1.0 and 0.0 <= throttle <= 1.0
+                and 0.0 <= brake <= 1.0 and 0.0 <= clutch <= 1.0):
+            raw = [steer, throttle, brake, clutch]
+            steer, throttle, brake, clutch = np.clip(raw, _ACTION_LO, _ACTION_HI).tolist()
+            logger.warning("action_out_of_range", action=raw,
+                           clipped=[steer, throttle, brake, clutch])
         
         # Apply action immediately
         self.bridge.apply_action(steer, throttle, brake, clutch)
@@ -127,17 +134,21 @@ class RealTimeStepper:
         seq, t_wall, dt, dt_actual = self.ticker.tick()
         
         # Sample observation AFTER action has been applied
-        obs, info = self.bridge.latest_obs()
-        
-        # Enrich info with step metadata
-        info.update({
-            'step_seq': seq,
-            'step_t_wall': t_wall,
-            'step_dt': dt,
-            'step_dt_actual': dt_actual,
-            'step_count': self.step_count,
-            'action': action.tolist() if isinstance(action, np.ndarray) else list(action)
-        })
+        if self.telemetry_info or self.verify_action_applied:
+            obs, info = self.bridge.latest_obs()
+        else:
+            obs = np.empty(self.bridge.obs_dim, dtype=np.float32)
+            self.bridge.latest_obs_into(obs)
+            info = {}
+        
+        # Enrich info with step metadata. info is a fresh dict built for this
+        # call, so store into it directly (no temporary dict + update())
+        info['step_seq'] = seq
+        info['step_t_wall'] = t_wall
+        info['step_dt'] = dt
+        info['step_dt_actual'] = dt_actual
+        info['step_count'] = self.step_count
+        info['action'] = [steer, throttle, brake, clutch]  # As applied (after clipping)
         
         # Optional: verify action was applied (debugging only)
         if self.verify_action_applied:
@@ -170,11 +181,9 @@ class RealTimeStepper:
         obs, info = self.bridge.latest_obs()
         
         # Add reset metadata
-        info.update({
-            'step_seq': 0,
-            'step_count': 0,
-            'episode_reset': True
-        })
+        info['step_seq'] = 0
+        info['step_count'] = 0
+        info['episode_reset'] = True
         
         return obs, info
     
@@ -0,0 +1,195 @@
+"""
+Compiled kernels for the telemetry hot paths.
+
+compute_derived() turns the staged wheel slip, car damage and tyre wear
+arrays into the packet's derived fields (average slip, wheel lock, damage
+flags) in one call, replacing ~6 generator/list walks over ctypes arrays
+per tick. Without numba it is a plain Python function with the same
+signature, so the streamers make the same call either way.
+
+fill_obs() writes ACBridgeLocal's normalized base observation straight out
+of the staged physics page. Both its compiled and its NumPy version gather
+through the same OBS_FIELDS table, so they cannot drift apart.
+"""
+
+import ctypes
+
+import numpy as np
+import structlog
+
+from ac_bridge.telemetry.ac_native_memory import SPageFilePhysics
+
+logger = structlog.get_logger()
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("numba_not_available",
+                 msg="Telemetry streamers will compute derived metrics in Python "
+                     "and ACBridgeLocal will gather obs with NumPy. Install with: uv add numba")
+
+
+def compute_derived(wheel_slip, car_damage, tyre_wear, brake, locked):
+    """
+    Compute the derived telemetry metrics.
+
+    Args:
+        wheel_slip: float32 (4,) view of SPageFilePhysics.wheelSlip
+        car_damage: float32 (5,) view of SPageFilePhysics.carDamage
+        tyre_wear: float32 (4,) view of SPageFilePhysics.tyreWear
+        brake: Brake input (0-1)
+        locked: bool (4,) output, set to the per-wheel lock mask (slip > 0.5)
+
+    Returns:
+        (avg_wheel_slip, wheel_lock_detected, bodywork_damaged,
+         bodywork_critical, tyre_damaged, tyre_critical)
+
+    Used by TelemetryClient.stream_telemetry() and TelemetryServer._sample_loop().
+    """
+    slips = wheel_slip.tolist()
+    avg_slip = sum(slips) * 0.25
+    np.greater(wheel_slip, 0.5, out=locked)
+
+    # One max per array serves both thresholds
+    damage_max = max(car_damage.tolist())
+    wear_max = max(tyre_wear.tolist())
+
+    return (
+        avg_slip,
+        brake > 0.5 and avg_slip > 0.5,
+        damage_max > 0.05,
+        damage_max > 0.50,
+        wear_max > 0.80,
+        wear_max > 0.95,
+    )
+
+
+def _compute_derived_compiled(wheel_slip, car_damage, tyre_wear, brake, locked):
+    """Loop form of compute_derived() for numba."""
+    # Summed in float64, like the builtin sum() in compute_derived()
+    s = 0.0
+    for k in range(4):
+        s += wheel_slip[k]
+        locked[k] = wheel_slip[k] > 0.5
+    avg_slip = s * 0.25
+
+    damage_max = car_damage[0]
+    for k in range(1, 5):
+        damage_max = max(damage_max, car_damage[k])
+
+    wear_max = tyre_wear[0]
+    for k in range(1, 4):
+        wear_max = max(wear_max, tyre_wear[k])
+
+    return (
+        avg_slip,
+        brake > 0.5 and avg_slip > 0.5,
+        damage_max > 0.05,
+        damage_max > 0.50,
+        wear_max > 0.80,
+        wear_max > 0.95,
+    )
+
+
+if NUMBA_AVAILABLE:
+    # Eager signature: compiled (or loaded from the on-disk cache) at import
+    # time, so the first streamed packet never pays JIT latency
+    compute_derived = njit(
+        "Tuple((float64, boolean, boolean, boolean, boolean, boolean))"
+        "(float32[::1], float32[::1], float32[::1], float32, boolean[::1])",
+        cache=True,
+        fastmath=True
+    )(_compute_derived_compiled)
+
+
+# Base observation layout: (first obs slot, SPageFilePhysics field) for every
+# feature that is a plain copy of a page field. Array fields fill one slot
+# per element. Slots 12 (wheel slip) and 14 (damage) are reductions, see
+# fill_obs(). Keep in sync with client.OBS_SCALE and client.OBS_DTYPE!
+OBS_FIELDS = (
+    (0, 'speedKmh'),
+    (1, 'velocity'),            # 1-3: x, y, z
+    (4, 'gas'),
+    (5, 'brake'),
+    (6, 'steerAngle'),
+    (7, 'rpms'),
+    (8, 'gear'),
+    (9, 'accG'),                # 9-11: lateral, longitudinal, vertical g
+    (13, 'numberOfTyresOut'),
+)
+
+
+def _build_obs_gather():
+    """Expand OBS_FIELDS into (dst slot, page word) index arrays per dtype."""
+    types = dict(SPageFilePhysics._fields_)
+    dst = {np.float32: [], np.int32: []}
+    src = {np.float32: [], np.int32: []}
+    for slot, name in OBS_FIELDS:
+        ctype = types[name]
+        if issubclass(ctype, ctypes.Array):
+            n, base = ctype._length_, ctype._type_
+        else:
+            n, base = 1, ctype
+        kind = np.int32 if base is ctypes.c_int32 else np.float32
+        # Every SPageFilePhysics field is 4 bytes wide, so a field's
+        # offset / 4 is its index into a float32 (or int32) view of the page
+        word = getattr(SPageFilePhysics, name).offset // 4
+        dst[kind].extend(range(slot, slot + n))
+        src[kind].extend(range(word, word + n))
+    as_idx = lambda x: np.array(x, dtype=np.int64)
+    return (as_idx(dst[np.float32]), as_idx(src[np.float32]),
+            as_idx(dst[np.int32]), as_idx(src[np.int32]))
+
+
+_OBS_F_DST, _OBS_F_SRC, _OBS_I_DST, _OBS_I_SRC = _build_obs_gather()
+_OBS_SLIP = SPageFilePhysics.wheelSlip.offset // 4
+_OBS_DAMAGE = SPageFilePhysics.carDamage.offset // 4
+
+
+def fill_obs(out, pf, pi, scale):
+    """
+    Write the 15 normalized base features into ``out``.
+
+    Args:
+        out: float32 output (at least client.BASE_OBS_DIM long)
+        pf: float32 view of the staged physics page
+        pi: int32 view of the same page (for rpms, gear, tyres out)
+        scale: client.OBS_SCALE
+    """
+    out[_OBS_F_DST] = pf[_OBS_F_SRC] * scale[_OBS_F_DST]
+    out[_OBS_I_DST] = pi[_OBS_I_SRC].astype(np.float32) * scale[_OBS_I_DST]
+    # Summed in float64, like the compiled loop
+    out[12] = np.float32(pf[_OBS_SLIP:_OBS_SLIP + 4].sum(dtype=np.float64)) * scale[12]
+    out[14] = scale[14] if pf[_OBS_DAMAGE:_OBS_DAMAGE + 5].max() > 0.05 else np.float32(0.0)
+
+
+def _fill_obs_compiled(out, pf, pi, scale):
+    """Loop form of fill_obs() for numba (no temporaries from fancy indexing)."""
+    for j in range(_OBS_F_DST.shape[0]):
+        d = _OBS_F_DST[j]
+        out[d] = pf[_OBS_F_SRC[j]] * scale[d]
+    for j in range(_OBS_I_DST.shape[0]):
+        d = _OBS_I_DST[j]
+        out[d] = np.float32(pi[_OBS_I_SRC[j]]) * scale[d]
+
+    s = 0.0
+    for k in range(4):
+        s += pf[_OBS_SLIP + k]
+    out[12] = np.float32(s) * scale[12]
+
+    m = pf[_OBS_DAMAGE]
+    for k in range(1, 5):
+        m = max(m, pf[_OBS_DAMAGE + k])
+    out[14] = scale[14] if m > 0.05 else np.float32(0.0)
+
+
+if NUMBA_AVAILABLE:
+    # The index arrays are module globals, so numba freezes them into the
+    # compiled code (and the on-disk cache is keyed on this file)
+    fill_obs = njit(
+        "void(float32[::1], float32[::1], int32[::1], float32[::1])",
+        cache=True,
+        fastmath=True
+    )(_fill_obs_compiled)
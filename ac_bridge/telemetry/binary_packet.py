@@ -0,0 +1,126 @@
+"""
+Binary telemetry record layouts: one fixed-size little-endian struct per packet.
+
+TelemetryServer (SUBPROTOCOL_BINARY) and TelemetryClient
+(packet_format="binary") pack the same fields; they only differ in the
+leading time field. Each layout has its own schema version, written as the
+first uint32 of every record, so decode_binary_telemetry() can tell them
+apart.
+"""
+
+import struct
+from dataclasses import dataclass
+
+# Fields after the time field: (key, struct code, count), in record order.
+# Bump the versions below whenever this table changes
+BINARY_FIELDS = (
+    ('packet_id', 'i', 1),
+    ('speed_kmh', 'f', 1), ('rpm', 'i', 1), ('gear', 'i', 1),
+    ('gas', 'f', 1), ('brake', 'f', 1), ('clutch', 'f', 1), ('steer_angle', 'f', 1),
+    ('velocity', 'f', 3), ('local_velocity', 'f', 3), ('angular_velocity', 'f', 3),
+    ('yaw', 'f', 1), ('pitch', 'f', 1), ('roll', 'f', 1),
+    ('acc_g', 'f', 3), ('world_position', 'f', 3),
+    ('wheel_slip', 'f', 4), ('wheel_angular_speed', 'f', 4), ('wheel_load', 'f', 4),
+    ('wheel_pressure', 'f', 4), ('suspension_travel', 'f', 4),
+    ('avg_wheel_slip', 'd', 1), ('wheel_lock_detected', '?', 1), ('locked_wheels', '?', 4),
+    ('car_damage', 'f', 5), ('bodywork_damaged', '?', 1), ('bodywork_critical', '?', 1),
+    ('tyre_wear', 'f', 4), ('tyre_damaged', '?', 1), ('tyre_critical', '?', 1),
+    ('brake_temp', 'f', 4), ('tyre_core_temp', 'f', 4), ('air_temp', 'f', 1), ('road_temp', 'f', 1),
+    ('number_of_tyres_out', 'i', 1), ('is_lap_valid', '?', 1), ('completed_laps', 'i', 1),
+    ('current_time', 'i', 1), ('last_time', 'i', 1), ('best_time', 'i', 1),
+    ('distance_traveled', 'f', 1), ('normalized_position', 'f', 1), ('current_sector_index', 'i', 1),
+    ('surface_grip', 'f', 1), ('tc', 'f', 1), ('is_in_pit', '?', 1), ('is_in_pit_lane', '?', 1),
+    ('fuel', 'f', 1),
+)
+
+# Keys split into _x/_y/_z in the JSON packet
+XYZ_KEYS = frozenset((
+    'velocity', 'local_velocity', 'angular_velocity', 'acc_g', 'world_position'
+))
+
+_VERSION = struct.Struct('<I')
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryLayout:
+    """
+    One binary record layout.
+
+    Records are: version (uint32), the time field, then BINARY_FIELDS.
+    ``fields`` lists (key, struct code, count) for everything after the
+    version, ``packet`` is the matching struct.
+    """
+
+    version: int
+    fields: tuple
+    packet: struct.Struct
+
+    def flat_fields(self) -> tuple:
+        """(key, code, count) with XYZ_KEYS split into _x/_y/_z scalars (JSON packet order)."""
+        flat = []
+        for key, code, count in self.fields:
+            if key in XYZ_KEYS:
+                flat += [(f'{key}_{axis}', code, 1) for axis in 'xyz']
+            else:
+                flat.append((key, code, count))
+        return tuple(flat)
+
+
+def _make_layout(version: int, time_key: str, time_code: str) -> BinaryLayout:
+    fields = ((time_key, time_code, 1),) + BINARY_FIELDS
+    fmt = '<I' + ''.join(f'{count}{code}' if count > 1 else code for _, code, count in fields)
+    return BinaryLayout(version=version, fields=fields, packet=struct.Struct(fmt))
+
+
+# TelemetryServer: 'timestamp' is the server's tick counter (uint32)
+SERVER_LAYOUT = _make_layout(1, 'timestamp', 'I')
+# TelemetryClient: 't_ns' is perf_counter_ns() of the snapshot (int64)
+CLIENT_LAYOUT = _make_layout(2, 't_ns', 'q')
+
+LAYOUTS = {layout.version: layout for layout in (SERVER_LAYOUT, CLIENT_LAYOUT)}
+
+
+def decode_binary_telemetry(data: bytes) -> list:
+    """
+    Decode a binary telemetry frame from either layout into packet dicts.
+
+    Args:
+        data: One binary WebSocket frame (batch_size records back to back)
+
+    Returns:
+        List of packets with the same keys as the JSON format
+
+    Raises:
+        ValueError: If the schema version is unknown, or the frame size or
+            a record's version doesn't match
+    """
+    if len(data) < _VERSION.size:
+        raise ValueError(f"Binary telemetry frame of {len(data)} bytes is too short")
+    version, = _VERSION.unpack_from(data)
+    layout = LAYOUTS.get(version)
+    if layout is None:
+        raise ValueError(f"Unknown binary telemetry schema version {version}")
+
+    size = layout.packet.size
+    if len(data) % size:
+        raise ValueError(f"Binary telemetry frame of {len(data)} bytes is not a multiple of {size}")
+
+    packets = []
+    for values in layout.packet.iter_unpack(data):
+        if values[0] != version:
+            raise ValueError(
+                f"Binary telemetry schema version {values[0]} in a version {version} frame"
+            )
+
+        packet = {}
+        i = 1
+        for key, _, count in layout.fields:
+            if count == 1:
+                packet[key] = values[i]
+            elif key in XYZ_KEYS:
+                packet[f'{key}_x'], packet[f'{key}_y'], packet[f'{key}_z'] = values[i:i + 3]
+            else:
+                packet[key] = list(values[i:i + count])
+            i += count
+        packets.append(packet)
+    return packets
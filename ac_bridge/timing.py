@@ -5,12 +5,133 @@ Provides drift-correcting ticker that maintains stable frequencies
 for telemetry polling and control loops.
 """
 
+import atexit
+import sys
 import time
 from typing import Iterator, Tuple
 import structlog
 
 logger = structlog.get_logger()
 
+# precise_sleep_until() busy-waits for the last stretch before a deadline;
+# time.sleep() only has to get within this margin
+SPIN_THRESHOLD = 0.001  # seconds
+SPIN_THRESHOLD_NS = 1_000_000  # same, for precise_sleep_until_ns()
+
+
+def precise_sleep_until(deadline: float) -> float:
+    """
+    Sleep until a perf_counter() deadline with sub-millisecond accuracy.
+    
+    Sleeps until SPIN_THRESHOLD before the deadline, then spins on
+    perf_counter() for the rest. Keeps tick jitter in the ~100 µs range
+    without pegging a core for the whole period.
+    
+    Args:
+        deadline: Target time in perf_counter() seconds
+    
+    Returns:
+        The perf_counter() reading at wake-up (>= deadline), so callers
+        don't need to read the clock again
+    """
+    now = time.perf_counter()
+    if deadline - now > SPIN_THRESHOLD:
+        time.sleep(deadline - now - SPIN_THRESHOLD)
+        now = time.perf_counter()
+    
+    while now < deadline:
+        now = time.perf_counter()
+    return now
+
+
+def precise_sleep_until_ns(deadline_ns: int) -> int:
+    """
+    precise_sleep_until() for an integer perf_counter_ns() deadline.
+    
+    Args:
+        deadline_ns: Target time in perf_counter_ns() nanoseconds
+    
+    Returns:
+        The perf_counter_ns() reading at wake-up (>= deadline_ns)
+    """
+    now = time.perf_counter_ns()
+    if deadline_ns - now > SPIN_THRESHOLD_NS:
+        time.sleep((deadline_ns - now - SPIN_THRESHOLD_NS) / 1e9)
+        now = time.perf_counter_ns()
+    
+    while now < deadline_ns:
+        now = time.perf_counter_ns()
+    return now
+
+
+def precise_sleep(duration: float) -> None:
+    """
+    Sleep for ``duration`` seconds with sub-millisecond accuracy.
+    
+    For short fixed waits (e.g. vJoy button presses) where time.sleep()
+    would round up to the OS timer resolution (~15.6 ms on Windows).
+    
+    Args:
+        duration: Wait time in seconds
+    """
+    precise_sleep_until(time.perf_counter() + duration)
+
+
+def enable_high_resolution_timer() -> bool:
+    """
+    Raise the Windows system timer resolution to 1 ms (timeBeginPeriod).
+    
+    The default 15.6 ms resolution makes time.sleep() overshoot short waits
+    badly. No-op on other platforms. Pair with disable_high_resolution_timer().
+    
+    Returns:
+        True if the resolution was changed
+    """
+    if sys.platform != "win32":
+        return False
+    
+    try:
+        import ctypes
+        ctypes.WinDLL("winmm").timeBeginPeriod(1)
+        return True
+    except OSError as e:
+        logger.warning("timer_resolution_unavailable", error=str(e))
+        return False
+
+
+def disable_high_resolution_timer() -> None:
+    """Undo enable_high_resolution_timer() (timeEndPeriod). No-op off Windows."""
+    if sys.platform != "win32":
+        return
+    
+    try:
+        import ctypes
+        ctypes.WinDLL("winmm").timeEndPeriod(1)
+    except OSError:
+        pass
+
+
+# Whether Ticker has taken its process-wide timeBeginPeriod(1) reference
+_timer_held = False
+
+
+def _hold_high_resolution_timer() -> None:
+    """
+    Take one process-wide high-resolution timer reference for Ticker.
+    
+    Only the first call does anything: it enables the 1 ms timer and
+    registers a single atexit handler to release it, so creating Tickers
+    repeatedly (e.g. after every AC reconnect) doesn't stack up
+    timeBeginPeriod calls or atexit handlers. The reference nests with
+    ACBridgeLocal.connect()/close()'s own enable/disable pair.
+    """
+    global _timer_held
+    if _timer_held:
+        return
+    _timer_held = True
+    if enable_high_resolution_timer():
+        atexit.register(disable_high_resolution_timer)
+
 
 class MonotonicClock:
     """
@@ -72,23 +193,37 @@ class Ticker:
         self.hz = hz
         self.dt_target = 1.0 / hz
         self.seq = start_seq
+        self._seq_origin = start_seq  # seq at t_start, for absolute deadlines
+        
+        # The sleep-then-spin wait relies on time.sleep() landing within
+        # SPIN_THRESHOLD of its target, which needs the 1 ms Windows timer
+        _hold_high_resolution_timer()
         
+        # Tick times are integer perf_counter_ns() readings: tick k's deadline
+        # is computed exactly, never from an inexact float 1/hz
         self.clock = MonotonicClock()
-        self.t_start = self.clock.now()
-        self.t_last = self.t_start
-        self.t_next = self.t_start + self.dt_target
+        self.t_start_ns = time.perf_counter_ns()
+        self.t_last_ns = self.t_start_ns
+        self.t_next_ns = self.t_start_ns + self._offset_ns(1)
         
-        # Statistics
-        self.total_drift = 0.0
+        # Statistics (total drift is derived from the tick times, see below)
         self.max_jitter = 0.0
+        self._last_warn_ns = None  # perf_counter_ns() of the last drift warning
+        
+        # Bound once: a concrete logger with hz in its context, so the drift
+        # warning doesn't go through the lazy module-level proxy each time
+        self._log = logger.bind(component="ticker", hz=hz)
         
-        logger.info(
+        self._log.info(
             "ticker_initialized",
-            hz=hz,
             dt_target=self.dt_target,
             start_seq=start_seq
         )
     
+    def _offset_ns(self, ticks: int) -> int:
+        """Ideal time of ``ticks`` ticks after t_start_ns, in whole nanoseconds."""
+        return ticks * 1_000_000_000 // self.hz
+    
     def __iter__(self) -> Iterator[Tuple[int, float, float, float]]:
         """Make ticker iterable."""
         return self
@@ -100,43 +235,55 @@ class Ticker:
         Returns:
             (seq, t_wall, dt_target, dt_actual)
         """
-        # Calculate how long to sleep
-        t_now = self.clock.now()
-        sleep_time = self.t_next - t_now
-        
-        # Sleep if we're ahead of schedule
-        if sleep_time > 0:
-            time.sleep(sleep_time)
+        # Wait for the absolute deadline (returns at once if we're behind).
+        # The wake-up reading is the tick time: same perf_counter() base as
+        # self.clock, without a second clock read
+        t_now_ns = precise_sleep_until_ns(self.t_next_ns)
         
-        # Update times
-        t_now = self.clock.now()
-        dt_actual = t_now - self.t_last
+        # Update times (seconds only at the API boundary)
+        dt_actual = (t_now_ns - self.t_last_ns) / 1e9
         
         # Track statistics
         jitter = abs(dt_actual - self.dt_target)
-        self.max_jitter = max(self.max_jitter, jitter)
-        self.total_drift += (dt_actual - self.dt_target)
+        if jitter > self.max_jitter:
+            self.max_jitter = jitter
         
         # Prepare return values
         seq = self.seq
-        t_wall = t_now
+        t_wall = t_now_ns / 1e9
         
-        # Update state for next tick
-        self.t_last = t_now
-        self.t_next = self.t_start + (self.seq + 1) * self.dt_target
+        # Update state for next tick. Deadlines are absolute: tick k is due
+        # at t_start + (k + 1) * dt, so oversleeping never accumulates.
+        self.t_last_ns = t_now_ns
         self.seq += 1
+        self.t_next_ns = self.t_start_ns + self._offset_ns(self.seq - self._seq_origin + 1)
         
-        # Log drift warning if getting too large
-        if abs(self.total_drift) > 0.1:  # 100ms total drift
-            logger.warning(
-                "ticker_drift_warning",
-                total_drift_ms=self.total_drift * 1000,
-                max_jitter_ms=self.max_jitter * 1000,
-                seq=seq
-            )
+        # Log drift warning if getting too large, at most once per second
+        # (a console write every tick would make the drift worse)
+        if self._last_warn_ns is None or t_now_ns - self._last_warn_ns > 1_000_000_000:
+            total_drift = self.total_drift
+            if abs(total_drift) > 0.1:  # 100ms total drift
+                self._last_warn_ns = t_now_ns
+                self._log.warning(
+                    "ticker_drift_warning",
+                    total_drift_ms=total_drift * 1000,
+                    max_jitter_ms=self.max_jitter * 1000,
+                    seq=seq
+                )
         
         return seq, t_wall, self.dt_target, dt_actual
     
+    @property
+    def total_drift(self) -> float:
+        """
+        Accumulated drift in seconds: sum of (dt_actual - dt_target) over all ticks.
+        
+        The sum telescopes to the last tick time minus its ideal time, so it
+        is computed on demand instead of accumulated every tick.
+        """
+        ticks = self.seq - self._seq_origin
+        return (self.t_last_ns - self.t_start_ns - self._offset_ns(ticks)) / 1e9
+    
     def tick(self) -> Tuple[int, float, float, float]:
         """
         Alternative method name for explicit tick.
@@ -154,13 +301,14 @@ class Ticker:
             start_seq: New starting sequence number
         """
         self.seq = start_seq
-        self.t_start = self.clock.now()
-        self.t_last = self.t_start
-        self.t_next = self.t_start + self.dt_target
-        self.total_drift = 0.0
+        self._seq_origin = start_seq
+        self.t_start_ns = time.perf_counter_ns()
+        self.t_last_ns = self.t_start_ns
+        self.t_next_ns = self.t_start_ns + self._offset_ns(1)
         self.max_jitter = 0.0
+        self._last_warn_ns = None
         
-        logger.info("ticker_reset", start_seq=start_seq)
+        self._log.info("ticker_reset", start_seq=start_seq)
     
     def get_stats(self) -> dict:
         """
@@ -169,7 +317,7 @@ class Ticker:
         Returns:
             dict with drift and jitter metrics
         """
-        elapsed = self.clock.now() - self.t_start
+        elapsed = (time.perf_counter_ns() - self.t_start_ns) / 1e9
         expected_ticks = int(elapsed * self.hz)
         actual_ticks = self.seq
         
@@ -7,13 +7,34 @@ behind NAT/firewall and can't accept incoming connections.
 """
 
 import asyncio
+import ctypes
 import json
+import time
+import numpy as np
 import structlog
+from typing import Optional
 import websockets
 from websockets.client import WebSocketClientProtocol
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
+
+from ac_bridge.telemetry import _kernels
+# decode_binary_telemetry is re-exported for receivers of packet_format="binary"
+from ac_bridge.telemetry.binary_packet import CLIENT_LAYOUT, decode_binary_telemetry
 
 logger = structlog.get_logger()
 
+# orjson is optional: packets are serialized with it when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.debug("orjson_not_available",
+                 msg="Telemetry will be serialized with the stdlib json module. Install with: uv add orjson")
+
+# Stdlib fallback encoder: packets never contain cycles, and skipping the
+# circular-reference bookkeeping makes each dumps ~25% cheaper
+_json_encode = json.JSONEncoder(check_circular=False).encode
 
 class TelemetryClient:
     """
@@ -24,157 +45,300 @@ class TelemetryClient:
         await client.start()
     """
     
-    def __init__(self, uri: str, rate_hz: int = 10, reconnect_delay: int = 5):
+    def __init__(
+        self,
+        uri: str,
+        rate_hz: int = 10,
+        reconnect_delay: int = 5,
+        batch_size: int = 1,
+        packet_format: str = "json",
+        compression: Optional[str] = "deflate"
+    ):
+        """
+        Args:
+            uri: Remote WebSocket server URI
+            rate_hz: Telemetry send rate
+            reconnect_delay: Seconds to wait before reconnecting
+            batch_size: Packets per WebSocket frame. 1 sends each packet as
+                its own JSON object; N > 1 sends a JSON array of N packets
+                per frame (N x fewer frames/TLS records, up to N / rate_hz
+                seconds of added latency)
+            packet_format: "json" (text frames, one object or array per
+                frame) or "binary" (fixed CLIENT_LAYOUT records, no field
+                names, packed into a reused buffer; decode with
+                decode_binary_telemetry())
+            compression: "deflate" (permessage-deflate with a 4 KB window and
+                memLevel 5, for bandwidth-limited links to the cloud) or None
+                (send frames uncompressed, e.g. on a LAN). Deflate is only
+                used if the server accepts it
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if packet_format not in ("json", "binary"):
+            raise ValueError(f"packet_format must be 'json' or 'binary', got {packet_format!r}")
+        if compression not in (None, "deflate"):
+            raise ValueError(f"compression must be None or 'deflate', got {compression!r}")
         self.uri = uri
         self.rate_hz = rate_hz
         self.reconnect_delay = reconnect_delay
+        self.batch_size = batch_size
+        self.packet_format = packet_format
+        self.compression = compression
         self.running = False
         
     async def stream_telemetry(self, websocket: WebSocketClientProtocol):
         """
         Read telemetry from AC and stream to remote server.
         """
-        from ac_bridge.telemetry.ac_native_memory import ACSharedMemory
+        from ac_bridge.telemetry.ac_native_memory import (
+            ACSharedMemory, SPageFileGraphic, SPageFilePhysics
+        )
         
         asm = ACSharedMemory()
+        
+        # Preallocated staging copies of the physics/graphics pages: each tick
+        # is one memmove per page, and the packet is built from the copies, so
+        # every field comes from the same instant (AC keeps writing the live
+        # pages while we read them)
+        p = SPageFilePhysics()
+        g = SPageFileGraphic()
+        p_src, p_dst = ctypes.addressof(asm.physics), ctypes.addressof(p)
+        g_src, g_dst = ctypes.addressof(asm.graphics), ctypes.addressof(g)
+        p_size = ctypes.sizeof(SPageFilePhysics)
+        g_size = ctypes.sizeof(SPageFileGraphic)
+        
+        # Zero-copy float32 views of the staged page's list fields. They feed
+        # the derived-metrics kernel, and ndarray.tolist() reads a whole field
+        # out ~4x faster than list(ctypes_array), with the same float values
+        as_array = np.ctypeslib.as_array
+        v_slip, v_wheel_speed, v_load = as_array(p.wheelSlip), as_array(p.wheelAngularSpeed), as_array(p.wheelLoad)
+        v_pressure, v_suspension = as_array(p.wheelsPressure), as_array(p.suspensionTravel)
+        v_damage, v_wear = as_array(p.carDamage), as_array(p.tyreWear)
+        v_brake_temp, v_core_temp = as_array(p.brakeTemp), as_array(p.tyreCoreTemperature)
+        locked = np.zeros(4, dtype=bool)
+        
+        # The staging structs never move, so their x/y/z vector fields can be
+        # bound once (each p.velocity etc. access builds a new ctypes array
+        # object). Indexing these gives Python floats, unlike the views
+        velocity, local_velocity, angular_velocity = p.velocity, p.localVelocity, p.localAngularVel
+        acc_g, car_coordinates = p.accG, g.carCoordinates
+        
+        telemetry = {}  # Packet dict, refilled in place every tick
+        batch = []  # Serialized packets waiting for the next frame (batch_size > 1)
+        batch_size = self.batch_size
+        
+        # Binary format: records are packed straight into one reused frame
+        # buffer; n_buffered records are waiting in it
+        binary = self.packet_format == "binary"
+        record_size = CLIENT_LAYOUT.packet.size
+        send_buf = bytearray(record_size * batch_size)
+        send_view = memoryview(send_buf)
+        n_buffered = 0
         sleep_time = 1.0 / self.rate_hz
-        packet_count = 0
         prev_lap = 0
         lap_invalidated = False
         
-        logger.info("telemetry_stream_started", rate_hz=self.rate_hz)
+        logger.info(
+            "telemetry_stream_started",
+            rate_hz=self.rate_hz,
+            batch_size=batch_size,
+            packet_format=self.packet_format
+        )
+        
+        # Absolute send deadlines on the event loop clock (like Ticker): a
+        # late wake-up shortens the next wait instead of accumulating drift
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time() + sleep_time
         
         try:
             while self.running:
                 # Check if AC is connected
                 if not asm.is_connected():
                     await asyncio.sleep(2)
+                    # Restart the schedule rather than bursting to catch up
+                    next_deadline = loop.time() + sleep_time
                     continue
                 
-                packet_count += 1
-                p = asm.physics
-                g = asm.graphics
+                ctypes.memmove(p_dst, p_src, p_size)
+                ctypes.memmove(g_dst, g_src, g_size)
+                t_ns = time.perf_counter_ns()  # When this snapshot was taken
+                
+                completed_laps = g.completedLaps
+                tyres_out = p.numberOfTyresOut
                 
                 # Detect lap completion
-                lap_complete = g.completedLaps > prev_lap
+                lap_complete = completed_laps > prev_lap
                 if lap_complete:
-                    prev_lap = g.completedLaps
+                    prev_lap = completed_laps
                     lap_invalidated = False
                 
                 # Track lap invalidity
-                if p.numberOfTyresOut > 2 and not lap_invalidated:
+                if tyres_out > 2 and not lap_invalidated:
                     lap_invalidated = True
                 
                 is_lap_valid = not lap_invalidated
                 
-                # Calculate derived metrics
-                avg_wheel_slip = sum(p.wheelSlip) / 4
-                wheel_lock_detected = p.brake > 0.5 and avg_wheel_slip > 0.5
-                locked_wheels_mask = [slip > 0.5 for slip in p.wheelSlip]
+                # Array fields for the packet
+                slips = v_slip.tolist()
+                damage = v_damage.tolist()
+                wear = v_wear.tolist()
                 
-                # Damage detection
-                bodywork_damaged = any(dmg > 0.05 for dmg in p.carDamage)
-                bodywork_critical = any(dmg > 0.50 for dmg in p.carDamage)
-                tyre_damaged = any(wear > 0.80 for wear in p.tyreWear)
-                tyre_critical = any(wear > 0.95 for wear in p.tyreWear)
+                # Derived metrics + damage detection in one call (compiled
+                # when numba is installed)
+                (avg_wheel_slip, wheel_lock_detected, bodywork_damaged,
+                 bodywork_critical, tyre_damaged, tyre_critical) = _kernels.compute_derived(
+                    v_slip, v_damage, v_wear, p.brake, locked
+                )
+                locked_wheels_mask = locked.tolist()
                 
-                # Build telemetry packet
-                telemetry = {
-                    'timestamp': packet_count,
-                    'packet_id': p.packetId,
+                if binary:
+                    # Argument order: CLIENT_LAYOUT.fields
+                    CLIENT_LAYOUT.packet.pack_into(
+                        send_buf, n_buffered * record_size, CLIENT_LAYOUT.version,
+                        t_ns, p.packetId,
+                        p.speedKmh, p.rpms, p.gear,
+                        p.gas, p.brake, p.clutch, p.steerAngle,
+                        *velocity, *local_velocity, *angular_velocity,
+                        p.heading, p.pitch, p.roll,
+                        *acc_g, *car_coordinates,
+                        *slips, *v_wheel_speed.tolist(), *v_load.tolist(),
+                        *v_pressure.tolist(), *v_suspension.tolist(),
+                        avg_wheel_slip, wheel_lock_detected, *locked_wheels_mask,
+                        *damage, bodywork_damaged, bodywork_critical,
+                        *wear, tyre_damaged, tyre_critical,
+                        *v_brake_temp.tolist(), *v_core_temp.tolist(), p.airTemp, p.roadTemp,
+                        tyres_out, is_lap_valid, completed_laps,
+                        g.iCurrentTime, g.iLastTime, g.iBestTime,
+                        g.distanceTraveled, g.normalizedCarPosition, g.currentSectorIndex,
+                        g.surfaceGrip, p.tc, g.isInPit, g.isInPitLane,
+                        p.fuel
+                    )
+                    n_buffered += 1
+                    if n_buffered == batch_size:
+                        # websockets copies the frame out before send() returns
+                        await websocket.send(send_view)
+                        n_buffered = 0
+                else:
+                    # Fill the telemetry packet (same dict every tick: the keys are
+                    # inserted on the first tick, later ticks only overwrite values)
+                    telemetry['t_ns'] = t_ns
+                    telemetry['packet_id'] = p.packetId
                     
                     # Basic car state
-                    'speed_kmh': p.speedKmh,
-                    'rpm': p.rpms,
-                    'gear': p.gear,
+                    telemetry['speed_kmh'] = p.speedKmh
+                    telemetry['rpm'] = p.rpms
+                    telemetry['gear'] = p.gear
                     
                     # Control inputs
-                    'gas': p.gas,
-                    'brake': p.brake,
-                    'clutch': p.clutch,
-                    'steer_angle': p.steerAngle,
+                    telemetry['gas'] = p.gas
+                    telemetry['brake'] = p.brake
+                    telemetry['clutch'] = p.clutch
+                    telemetry['steer_angle'] = p.steerAngle
                     
                     # Velocity (world and local)
-                    'velocity_x': p.velocity[0],
-                    'velocity_y': p.velocity[1],
-                    'velocity_z': p.velocity[2],
-                    'local_velocity_x': p.localVelocity[0],
-                    'local_velocity_y': p.localVelocity[1],
-                    'local_velocity_z': p.localVelocity[2],
+                    telemetry['velocity_x'] = velocity[0]
+                    telemetry['velocity_y'] = velocity[1]
+                    telemetry['velocity_z'] = velocity[2]
+                    telemetry['local_velocity_x'] = local_velocity[0]
+                    telemetry['local_velocity_y'] = local_velocity[1]
+                    telemetry['local_velocity_z'] = local_velocity[2]
                     
                     # Angular velocity (rotation rates)
-                    'angular_velocity_x': p.localAngularVel[0],
-                    'angular_velocity_y': p.localAngularVel[1],
-                    'angular_velocity_z': p.localAngularVel[2],
+                    telemetry['angular_velocity_x'] = angular_velocity[0]
+                    telemetry['angular_velocity_y'] = angular_velocity[1]
+                    telemetry['angular_velocity_z'] = angular_velocity[2]
                     
                     # Orientation
-                    'yaw': p.heading,
-                    'pitch': p.pitch,
-                    'roll': p.roll,
+                    telemetry['yaw'] = p.heading
+                    telemetry['pitch'] = p.pitch
+                    telemetry['roll'] = p.roll
                     
                     # G-forces
-                    'acc_g_x': p.accG[0],
-                    'acc_g_y': p.accG[1],
-                    'acc_g_z': p.accG[2],
+                    telemetry['acc_g_x'] = acc_g[0]
+                    telemetry['acc_g_y'] = acc_g[1]
+                    telemetry['acc_g_z'] = acc_g[2]
                     
                     # World position
-                    'world_position_x': g.carCoordinates[0],
-                    'world_position_y': g.carCoordinates[1],
-                    'world_position_z': g.carCoordinates[2],
+                    telemetry['world_position_x'] = car_coordinates[0]
+                    telemetry['world_position_y'] = car_coordinates[1]
+                    telemetry['world_position_z'] = car_coordinates[2]
                     
                     # Wheel dynamics
-                    'wheel_slip': list(p.wheelSlip),
-                    'wheel_angular_speed': list(p.wheelAngularSpeed),
-                    'wheel_load': list(p.wheelLoad),
-                    'wheel_pressure': list(p.wheelsPressure),
-                    'suspension_travel': list(p.suspensionTravel),
-                    'avg_wheel_slip': avg_wheel_slip,
-                    'wheel_lock_detected': wheel_lock_detected,
-                    'locked_wheels': locked_wheels_mask,
+                    telemetry['wheel_slip'] = slips
+                    telemetry['wheel_angular_speed'] = v_wheel_speed.tolist()
+                    telemetry['wheel_load'] = v_load.tolist()
+                    telemetry['wheel_pressure'] = v_pressure.tolist()
+                    telemetry['suspension_travel'] = v_suspension.tolist()
+                    telemetry['avg_wheel_slip'] = avg_wheel_slip
+                    telemetry['wheel_lock_detected'] = wheel_lock_detected
+                    telemetry['locked_wheels'] = locked_wheels_mask
                     
                     # Damage
-                    'car_damage': list(p.carDamage),
-                    'bodywork_damaged': bodywork_damaged,
-                    'bodywork_critical': bodywork_critical,
-                    'tyre_wear': list(p.tyreWear),
-                    'tyre_damaged': tyre_damaged,
-                    'tyre_critical': tyre_critical,
+                    telemetry['car_damage'] = damage
+                    telemetry['bodywork_damaged'] = bodywork_damaged
+                    telemetry['bodywork_critical'] = bodywork_critical
+                    telemetry['tyre_wear'] = wear
+                    telemetry['tyre_damaged'] = tyre_damaged
+                    telemetry['tyre_critical'] = tyre_critical
                     
                     # Temperature
-                    'brake_temp': list(p.brakeTemp),
-                    'tyre_core_temp': list(p.tyreCoreTemperature),
-                    'air_temp': p.airTemp,
-                    'road_temp': p.roadTemp,
+                    telemetry['brake_temp'] = v_brake_temp.tolist()
+                    telemetry['tyre_core_temp'] = v_core_temp.tolist()
+                    telemetry['air_temp'] = p.airTemp
+                    telemetry['road_temp'] = p.roadTemp
                     
                     # Track limits and lap
-                    'number_of_tyres_out': p.numberOfTyresOut,
-                    'is_lap_valid': is_lap_valid,
-                    'completed_laps': g.completedLaps,
-                    'current_time': g.iCurrentTime,
-                    'last_time': g.iLastTime,
-                    'best_time': g.iBestTime,
-                    'distance_traveled': g.distanceTraveled,
-                    'normalized_position': g.normalizedCarPosition,
-                    'current_sector_index': g.currentSectorIndex,
+                    telemetry['number_of_tyres_out'] = tyres_out
+                    telemetry['is_lap_valid'] = is_lap_valid
+                    telemetry['completed_laps'] = completed_laps
+                    telemetry['current_time'] = g.iCurrentTime
+                    telemetry['last_time'] = g.iLastTime
+                    telemetry['best_time'] = g.iBestTime
+                    telemetry['distance_traveled'] = g.distanceTraveled
+                    telemetry['normalized_position'] = g.normalizedCarPosition
+                    telemetry['current_sector_index'] = g.currentSectorIndex
                     
                     # Track conditions
-                    'surface_grip': g.surfaceGrip,
+                    telemetry['surface_grip'] = g.surfaceGrip
                     
                     # Assists
-                    'tc': p.tc,
+                    telemetry['tc'] = p.tc
                     
                     # Pit status
-                    'is_in_pit': bool(g.isInPit),
-                    'is_in_pit_lane': bool(g.isInPitLane),
+                    telemetry['is_in_pit'] = bool(g.isInPit)
+                    telemetry['is_in_pit_lane'] = bool(g.isInPitLane)
                     
                     # Fuel
-                    'fuel': p.fuel,
-                }
-                
-                # Send to remote server
-                await websocket.send(json.dumps(telemetry))
-                
-                await asyncio.sleep(sleep_time)
+                    telemetry['fuel'] = p.fuel
+                    
+                    # Send to remote server (as a text frame either way)
+                    if batch_size == 1:
+                        if ORJSON_AVAILABLE:
+                            await websocket.send(orjson.dumps(telemetry), text=True)
+                        else:
+                            await websocket.send(_json_encode(telemetry))
+                    else:
+                        batch.append(orjson.dumps(telemetry) if ORJSON_AVAILABLE else _json_encode(telemetry))
+                        if len(batch) >= batch_size:
+                            await self._send_batch(websocket, batch)
+                    
+                delay = next_deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # Late: still yield so pings and the receiver can run
+                    await asyncio.sleep(0)
+                    if delay < -sleep_time:
+                        # More than a tick behind (e.g. a stall): drop the
+                        # missed ticks instead of bursting to catch up
+                        next_deadline = loop.time()
+                next_deadline += sleep_time
+            
+            # Stopped cleanly: flush the partial batch
+            if batch:
+                await self._send_batch(websocket, batch)
+            if n_buffered:
+                await websocket.send(send_view[:n_buffered * record_size])
                 
         except Exception as e:
             logger.error("telemetry_stream_error", error=str(e))
@@ -183,6 +347,15 @@ class TelemetryClient:
             asm.close()
             logger.info("telemetry_stream_stopped")
     
+    @staticmethod
+    async def _send_batch(websocket: WebSocketClientProtocol, batch: list):
+        """Send the buffered packets as one JSON array text frame and clear the buffer."""
+        if ORJSON_AVAILABLE:
+            await websocket.send(b'[' + b','.join(batch) + b']', text=True)
+        else:
+            await websocket.send('[' + ','.join(batch) + ']')
+        batch.clear()
+    
     async def start(self):
         """
         Connect to remote server and stream telemetry.
@@ -191,11 +364,19 @@ class TelemetryClient:
         """
         self.running = True
         
+        extensions = None
+        if self.compression == "deflate":
+            extensions = [ClientPerMessageDeflateFactory(
+                client_max_window_bits=12, compress_settings={"memLevel": 5}
+            )]
+        
         while self.running:
             try:
                 logger.info("connecting_to_server", uri=self.uri)
                 
-                async with websockets.connect(self.uri) as websocket:
+                async with websockets.connect(
+                    self.uri, compression=None, extensions=extensions
+                ) as websocket:
                     logger.info("connected_to_server", uri=self.uri)
                     await self.stream_telemetry(websocket)
                     
@@ -8,14 +8,136 @@ Simple implementation for local development. The server:
 """
 
 import asyncio
+import ctypes
 import json
+import threading
+import time
+import numpy as np
 import structlog
-from typing import Set
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Union
 import websockets
+from websockets.extensions.permessage_deflate import ServerPerMessageDeflateFactory
 from websockets.server import WebSocketServerProtocol
 
+from ac_bridge.telemetry import _kernels
+from ac_bridge.telemetry.binary_packet import SERVER_LAYOUT
+
 logger = structlog.get_logger()
 
+# orjson is optional: packets are serialized with it when installed. Either
+# way the encoder is picked once here, not per packet
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _encode_packet = orjson.dumps
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.debug("orjson_not_available",
+                 msg="Telemetry will be serialized with the stdlib json module. Install with: uv add orjson")
+    # Packets never contain cycles, so skip the circular-reference bookkeeping
+    _encode_packet = json.JSONEncoder(check_circular=False).encode
+
+# msgpack is only needed for clients that ask for SUBPROTOCOL_MSGPACK
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    logger.debug("msgpack_not_available",
+                 msg="TelemetryServer won't offer the msgpack packet format. Install with: uv add msgpack")
+
+# Packet fields, in wire order. By default clients get each packet as a JSON
+# object; clients that negotiate SUBPROTOCOL_COMPACT get a schema message
+# listing these names once, then each packet as a flat JSON array of values
+FIELD_NAMES = (
+    'timestamp', 'packet_id', 'speed_kmh', 'rpm', 'gear', 'gas', 'brake', 'clutch',
+    'steer_angle', 'velocity_x', 'velocity_y', 'velocity_z', 'local_velocity_x',
+    'local_velocity_y', 'local_velocity_z', 'angular_velocity_x', 'angular_velocity_y',
+    'angular_velocity_z', 'yaw', 'pitch', 'roll', 'acc_g_x', 'acc_g_y', 'acc_g_z',
+    'world_position_x', 'world_position_y', 'world_position_z', 'wheel_slip',
+    'wheel_angular_speed', 'wheel_load', 'wheel_pressure', 'suspension_travel',
+    'avg_wheel_slip', 'wheel_lock_detected', 'locked_wheels', 'car_damage',
+    'bodywork_damaged', 'bodywork_critical', 'tyre_wear', 'tyre_damaged', 'tyre_critical',
+    'brake_temp', 'tyre_core_temp', 'air_temp', 'road_temp', 'number_of_tyres_out',
+    'is_lap_valid', 'completed_laps', 'current_time', 'last_time', 'best_time',
+    'distance_traveled', 'normalized_position', 'current_sector_index', 'surface_grip',
+    'tc', 'is_in_pit', 'is_in_pit_lane', 'fuel',
+)
+
+# Binary record layout (SUBPROTOCOL_BINARY): shared with TelemetryClient in
+# ac_bridge/telemetry/binary_packet.py. Flattened to one (key, code, count)
+# per FIELD_NAMES entry, the order packet values are built in
+_BINARY_FIELDS = SERVER_LAYOUT.flat_fields()
+assert tuple(key for key, _, _ in _BINARY_FIELDS) == FIELD_NAMES
+
+
+def _binary_runs() -> tuple:
+    """
+    Plan for flattening packet values into SERVER_LAYOUT.packet arguments.
+    
+    Returns (start, stop) slices of the values list for each run of scalar
+    fields and (index, None) for each list field, so a packet is flattened
+    with ~15 list extends instead of one step per field.
+    """
+    runs = []
+    for i, (_, _, count) in enumerate(_BINARY_FIELDS):
+        if count > 1:
+            runs.append((i, None))
+        elif runs and runs[-1][1] == i:
+            runs[-1] = (runs[-1][0], i + 1)
+        else:
+            runs.append((i, i + 1))
+    return tuple(runs)
+
+
+_BINARY_RUNS = _binary_runs()
+
+
+def _pack_binary(values: list) -> bytes:
+    """Pack one packet's values (FIELD_NAMES order) into a SERVER_LAYOUT record."""
+    args = [SERVER_LAYOUT.version]
+    for start, stop in _BINARY_RUNS:
+        if stop is None:
+            args += values[start]
+        else:
+            args += values[start:stop]
+    return SERVER_LAYOUT.packet.pack(*args)
+
+
+# WebSocket subprotocols selecting a client's packet format (none = JSON objects):
+# - compact: schema message, then JSON arrays; receivers rebuild packets with
+#   dict(zip(schema['fields'], values))
+# - msgpack: each packet as a MessagePack map (float32 floats) in a binary
+#   frame; receivers use msgpack.unpackb(message)
+# - binary: schema message (fields, struct format, counts), then each packet
+#   as one fixed-size SERVER_LAYOUT record in a binary frame; receivers use
+#   ac_bridge.telemetry.binary_packet.decode_binary_telemetry(message) or
+#   struct.unpack with schema['format']
+# With batch_size > 1, every format sends a list of packets per frame
+SUBPROTOCOL_COMPACT = "ac-bridge.compact"
+SUBPROTOCOL_MSGPACK = "ac-bridge.msgpack"
+SUBPROTOCOL_BINARY = "ac-bridge.binary"
+_SUBPROTOCOLS = (SUBPROTOCOL_COMPACT, SUBPROTOCOL_BINARY)
+if MSGPACK_AVAILABLE:
+    _SUBPROTOCOLS += (SUBPROTOCOL_MSGPACK,)
+
+
+def _select_subprotocol(connection, subprotocols):
+    """Pick the first packet format the client offers that we support; None = JSON objects."""
+    for subprotocol in subprotocols:
+        if subprotocol in _SUBPROTOCOLS:
+            return subprotocol
+    return None
+
+
+@dataclass(slots=True)
+class _ClientSender:
+    """A client's outgoing queue of (message, text) frames and the task draining it."""
+    queue: asyncio.Queue
+    task: asyncio.Task
+    drops: int = 0  # Consecutive broadcasts that found the queue full
+
 
 class TelemetryServer:
     """
@@ -26,43 +148,165 @@ class TelemetryServer:
         await server.start()
     """
     
-    def __init__(self, host: str = "localhost", port: int = 8765, rate_hz: int = 10):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 8765,
+        rate_hz: int = 10,
+        send_queue_size: int = 32,
+        max_consecutive_drops: int = 100,
+        compression: Optional[str] = None,
+        batch_size: int = 1,
+        ping_interval: Optional[float] = None
+    ):
+        """
+        Args:
+            host: Interface to listen on
+            port: Port to listen on
+            rate_hz: Telemetry broadcast rate
+            send_queue_size: Frames buffered per client. When a client's
+                queue is full, its oldest frame is dropped so a slow
+                consumer never blocks the loop or the other clients
+            max_consecutive_drops: Disconnect a client after this many
+                broadcasts in a row found its queue full (it has stalled)
+            compression: None (no permessage-deflate, the right call on a
+                LAN, where deflating every packet only adds CPU and
+                latency) or "deflate" (4 KB window, memLevel 5: most of the
+                ratio on the repetitive JSON keys at a fraction of zlib's
+                default memory per client)
+            batch_size: Packets per WebSocket frame. 1 sends each packet on
+                its own; N > 1 encodes N consecutive packets once as a list
+                (N x fewer encodes and frames, up to N / rate_hz seconds of
+                added latency)
+            ping_interval: Seconds between WebSocket keepalive pings, or None
+                (default) for none. The broadcast itself is the liveness
+                check: a dead client's send queue fills up and it is
+                disconnected after max_consecutive_drops ticks, without
+                pings interleaving with the tick schedule. Set this (e.g.
+                20) for links that sit idle while AC isn't running
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if compression not in (None, "deflate"):
+            raise ValueError(f"compression must be None or 'deflate', got {compression!r}")
         self.host = host
         self.port = port
         self.rate_hz = rate_hz
+        self.send_queue_size = send_queue_size
+        self.max_consecutive_drops = max_consecutive_drops
+        self.compression = compression
+        self.batch_size = batch_size
+        self.ping_interval = ping_interval
         self.clients: Set[WebSocketServerProtocol] = set()
+        # Subsets of clients that negotiated a non-default packet format
+        self.compact_clients: Set[WebSocketServerProtocol] = set()
+        self.msgpack_clients: Set[WebSocketServerProtocol] = set()
+        self.binary_clients: Set[WebSocketServerProtocol] = set()
+        self._senders: Dict[WebSocketServerProtocol, _ClientSender] = {}
+        self._closing: Set[asyncio.Task] = set()  # Strong refs to close() tasks
         self.running = False
         
     async def register(self, websocket: WebSocketServerProtocol):
         """Register a new client connection."""
+        queue = asyncio.Queue(maxsize=self.send_queue_size)
+        self._senders[websocket] = _ClientSender(
+            queue, asyncio.create_task(self._send_loop(websocket, queue))
+        )
         self.clients.add(websocket)
+        if websocket.subprotocol == SUBPROTOCOL_COMPACT:
+            self.compact_clients.add(websocket)
+            queue.put_nowait((_encode_packet({
+                'type': 'schema', 'fields': FIELD_NAMES, 'batch_size': self.batch_size
+            }), True))
+        elif websocket.subprotocol == SUBPROTOCOL_MSGPACK:
+            self.msgpack_clients.add(websocket)
+        elif websocket.subprotocol == SUBPROTOCOL_BINARY:
+            self.binary_clients.add(websocket)
+            queue.put_nowait((_encode_packet({
+                'type': 'schema',
+                'fields': FIELD_NAMES,
+                'format': SERVER_LAYOUT.packet.format,
+                'counts': [count for _, _, count in _BINARY_FIELDS],
+                'version': SERVER_LAYOUT.version,
+                'batch_size': self.batch_size,
+            }), True))
         logger.info("client_connected", 
                    remote=websocket.remote_address,
                    total_clients=len(self.clients))
         
     async def unregister(self, websocket: WebSocketServerProtocol):
         """Unregister a client that disconnected."""
+        if websocket not in self.clients:
+            return  # Already unregistered (send failure, then the handler exits)
+        
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender.task is not asyncio.current_task():
+            sender.task.cancel()
         self.clients.discard(websocket)
+        self.compact_clients.discard(websocket)
+        self.msgpack_clients.discard(websocket)
+        self.binary_clients.discard(websocket)
         logger.info("client_disconnected",
                    remote=websocket.remote_address,
                    total_clients=len(self.clients))
     
-    async def broadcast(self, message: str):
-        """Send message to all connected clients."""
-        if not self.clients:
+    async def broadcast(
+        self,
+        message: Union[str, bytes],
+        clients: Optional[Set] = None,
+        text: bool = True
+    ):
+        """
+        Queue message for connected clients.
+        
+        Never waits on the network: each client's own task does the send.
+        A client whose queue is full loses its oldest frame, and is
+        disconnected after max_consecutive_drops full queues in a row.
+        
+        Args:
+            message: Encoded message
+            clients: Recipients (default: all connected clients)
+            text: Send as a text frame (even if bytes); False for binary
+        """
+        if clients is None:
+            clients = self.clients
+        if not clients:
             return
-            
-        # Send to all clients, remove any that fail
-        disconnected = set()
-        for client in self.clients:
-            try:
-                await client.send(message)
-            except websockets.exceptions.ConnectionClosed:
-                disconnected.add(client)
         
-        # Clean up disconnected clients
-        for client in disconnected:
+        stalled = []
+        for client in clients:
+            sender = self._senders.get(client)
+            if sender is None:
+                continue
+            queue = sender.queue
+            if queue.full():
+                queue.get_nowait()  # Drop the oldest frame
+                sender.drops += 1
+                if sender.drops >= self.max_consecutive_drops:
+                    stalled.append(client)
+            else:
+                sender.drops = 0
+            queue.put_nowait((message, text))
+        
+        for client in stalled:
+            logger.warning("client_stalled", remote=client.remote_address,
+                           dropped=self.max_consecutive_drops)
             await self.unregister(client)
+            task = asyncio.create_task(client.close())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+    
+    async def _send_loop(self, websocket: WebSocketServerProtocol, queue: asyncio.Queue):
+        """Drain a client's queue into its connection until it fails or is unregistered."""
+        try:
+            while True:
+                message, text = await queue.get()
+                await websocket.send(message, text=text)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.warning("client_send_failed", remote=websocket.remote_address, error=str(e))
+        await self.unregister(websocket)
     
     async def handler(self, websocket: WebSocketServerProtocol):
         """
@@ -83,37 +327,83 @@ class TelemetryServer:
         finally:
             await self.unregister(websocket)
     
-    async def read_telemetry_loop(self):
+    def _sample_loop(self, loop: asyncio.AbstractEventLoop, samples: asyncio.Queue):
         """
-        Read telemetry from AC and broadcast to all clients.
+        Poll AC shared memory and hand each packet's values to the event loop.
         
-        This runs in parallel with the WebSocket server.
+        Runs in the sampler thread started by read_telemetry_loop(), so the
+        ctypes reads and packet building never hold up the WebSocket sends.
+        Puts None on ``samples`` when it stops.
         """
-        from ac_bridge.telemetry.ac_native_memory import ACSharedMemory
-        
-        asm = ACSharedMemory()
-        sleep_time = 1.0 / self.rate_hz
-        packet_count = 0
-        prev_lap = 0
-        lap_invalidated = False
-        
-        logger.info("telemetry_loop_started", rate_hz=self.rate_hz)
+        from ac_bridge.telemetry.ac_native_memory import (
+            ACSharedMemory, SPageFileGraphic, SPageFilePhysics
+        )
         
+        asm = None
         try:
+            asm = ACSharedMemory()
+            
+            # Preallocated staging copies of the physics/graphics pages: each
+            # tick is one memmove per page, and the packet is built from the
+            # copies, so every field comes from the same instant (AC keeps
+            # writing the live pages while we read them)
+            p = SPageFilePhysics()
+            g = SPageFileGraphic()
+            p_src, p_dst = ctypes.addressof(asm.physics), ctypes.addressof(p)
+            g_src, g_dst = ctypes.addressof(asm.graphics), ctypes.addressof(g)
+            p_size = ctypes.sizeof(SPageFilePhysics)
+            g_size = ctypes.sizeof(SPageFileGraphic)
+            
+            # Read every array field of the copies through a zero-copy view
+            # (one bulk tolist() instead of a ctypes descriptor lookup per
+            # element)
+            as_array = np.ctypeslib.as_array
+            v_slip = as_array(p.wheelSlip)
+            v_damage = as_array(p.carDamage)
+            v_wear = as_array(p.tyreWear)
+            v_velocity = as_array(p.velocity)
+            v_local_velocity = as_array(p.localVelocity)
+            v_angular_velocity = as_array(p.localAngularVel)
+            v_acc_g = as_array(p.accG)
+            v_position = as_array(g.carCoordinates)
+            v_wheel_speed = as_array(p.wheelAngularSpeed)
+            v_load = as_array(p.wheelLoad)
+            v_pressure = as_array(p.wheelsPressure)
+            v_suspension = as_array(p.suspensionTravel)
+            v_brake_temp = as_array(p.brakeTemp)
+            v_core_temp = as_array(p.tyreCoreTemperature)
+            locked = np.zeros(4, dtype=bool)
+            
+            sleep_time = 1.0 / self.rate_hz
+            packet_count = 0
+            prev_lap = 0
+            lap_invalidated = False
+            
+            logger.info("telemetry_loop_started", rate_hz=self.rate_hz)
+            
+            # Absolute tick deadlines (like Ticker): a late wake-up shortens the
+            # next wait instead of accumulating drift. Plain sleeps, no spinning:
+            # a spin would hold the GIL against the event loop
+            next_deadline = time.perf_counter() + sleep_time
+            
             while self.running:
                 # Check if AC is connected
                 if not asm.is_connected():
-                    await asyncio.sleep(2)
+                    time.sleep(2)
+                    # Restart the schedule rather than bursting to catch up
+                    next_deadline = time.perf_counter() + sleep_time
                     continue
                 
+                ctypes.memmove(p_dst, p_src, p_size)
+                ctypes.memmove(g_dst, g_src, g_size)
+                
                 packet_count += 1
-                p = asm.physics
-                g = asm.graphics
+                completed_laps = g.completedLaps
                 
                 # Detect lap completion
-                lap_complete = g.completedLaps > prev_lap
+                lap_complete = completed_laps > prev_lap
                 if lap_complete:
-                    prev_lap = g.completedLaps
+                    prev_lap = completed_laps
                     lap_invalidated = False
                 
                 # Track lap invalidity
@@ -122,121 +412,216 @@ class TelemetryServer:
                 
                 is_lap_valid = not lap_invalidated
                 
-                # Calculate derived metrics
-                avg_wheel_slip = sum(p.wheelSlip) / 4
-                wheel_lock_detected = p.brake > 0.5 and avg_wheel_slip > 0.5
-                locked_wheels_mask = [slip > 0.5 for slip in p.wheelSlip]
+                # Nobody listening: skip building and encoding the packet (the
+                # lap tracking above still runs, so a client that connects
+                # mid-lap gets the right is_lap_valid)
+                if not self.clients:
+                    next_deadline = self._sleep_until(next_deadline, sleep_time)
+                    continue
+                
+                # Array fields for the packet
+                # (ndarray.tolist() = one bulk read per array)
+                slips = v_slip.tolist()
+                damage = v_damage.tolist()
+                wear = v_wear.tolist()
+                brake = p.brake
                 
-                # Damage detection
-                bodywork_damaged = any(dmg > 0.05 for dmg in p.carDamage)
-                bodywork_critical = any(dmg > 0.50 for dmg in p.carDamage)
-                tyre_damaged = any(wear > 0.80 for wear in p.tyreWear)
-                tyre_critical = any(wear > 0.95 for wear in p.tyreWear)
+                # Derived metrics + damage detection in one call (compiled
+                # when numba is installed)
+                (avg_wheel_slip, wheel_lock_detected, bodywork_damaged,
+                 bodywork_critical, tyre_damaged, tyre_critical) = _kernels.compute_derived(
+                    v_slip, v_damage, v_wear, brake, locked
+                )
+                locked_wheels_mask = locked.tolist()
                 
-                # Build telemetry packet
-                telemetry = {
-                    'timestamp': packet_count,
-                    'packet_id': p.packetId,
+                # Packet values, in FIELD_NAMES order
+                values = [
+                    packet_count,                           # timestamp
+                    p.packetId,                             # packet_id
                     
                     # Basic car state
-                    'speed_kmh': p.speedKmh,
-                    'rpm': p.rpms,
-                    'gear': p.gear,
+                    p.speedKmh,                             # speed_kmh
+                    p.rpms,                                 # rpm
+                    p.gear,                                 # gear
                     
                     # Control inputs
-                    'gas': p.gas,
-                    'brake': p.brake,
-                    'clutch': p.clutch,
-                    'steer_angle': p.steerAngle,
+                    p.gas,                                  # gas
+                    brake,                                  # brake
+                    p.clutch,                               # clutch
+                    p.steerAngle,                           # steer_angle
                     
                     # Velocity (world and local)
-                    'velocity_x': p.velocity[0],
-                    'velocity_y': p.velocity[1],
-                    'velocity_z': p.velocity[2],
-                    'local_velocity_x': p.localVelocity[0],
-                    'local_velocity_y': p.localVelocity[1],
-                    'local_velocity_z': p.localVelocity[2],
+                    *v_velocity.tolist(),                   # velocity_x, _y, _z
+                    *v_local_velocity.tolist(),             # local_velocity_x, _y, _z
                     
                     # Angular velocity (rotation rates)
-                    'angular_velocity_x': p.localAngularVel[0],
-                    'angular_velocity_y': p.localAngularVel[1],
-                    'angular_velocity_z': p.localAngularVel[2],
+                    *v_angular_velocity.tolist(),           # angular_velocity_x, _y, _z
                     
                     # Orientation
-                    'yaw': p.heading,
-                    'pitch': p.pitch,
-                    'roll': p.roll,
+                    p.heading,                              # yaw
+                    p.pitch,                                # pitch
+                    p.roll,                                 # roll
                     
                     # G-forces
-                    'acc_g_x': p.accG[0],
-                    'acc_g_y': p.accG[1],
-                    'acc_g_z': p.accG[2],
+                    *v_acc_g.tolist(),                      # acc_g_x, _y, _z
                     
                     # World position
-                    'world_position_x': g.carCoordinates[0],
-                    'world_position_y': g.carCoordinates[1],
-                    'world_position_z': g.carCoordinates[2],
+                    *v_position.tolist(),                   # world_position_x, _y, _z
                     
                     # Wheel dynamics
-                    'wheel_slip': list(p.wheelSlip),
-                    'wheel_angular_speed': list(p.wheelAngularSpeed),
-                    'wheel_load': list(p.wheelLoad),
-                    'wheel_pressure': list(p.wheelsPressure),
-                    'suspension_travel': list(p.suspensionTravel),
-                    'avg_wheel_slip': avg_wheel_slip,
-                    'wheel_lock_detected': wheel_lock_detected,
-                    'locked_wheels': locked_wheels_mask,
+                    slips,                                  # wheel_slip
+                    v_wheel_speed.tolist(),                 # wheel_angular_speed
+                    v_load.tolist(),                        # wheel_load
+                    v_pressure.tolist(),                    # wheel_pressure
+                    v_suspension.tolist(),                  # suspension_travel
+                    avg_wheel_slip,                         # avg_wheel_slip
+                    wheel_lock_detected,                    # wheel_lock_detected
+                    locked_wheels_mask,                     # locked_wheels
                     
                     # Damage
-                    'car_damage': list(p.carDamage),
-                    'bodywork_damaged': bodywork_damaged,
-                    'bodywork_critical': bodywork_critical,
-                    'tyre_wear': list(p.tyreWear),
-                    'tyre_damaged': tyre_damaged,
-                    'tyre_critical': tyre_critical,
+                    damage,                                 # car_damage
+                    bodywork_damaged,                       # bodywork_damaged
+                    bodywork_critical,                      # bodywork_critical
+                    wear,                                   # tyre_wear
+                    tyre_damaged,                           # tyre_damaged
+                    tyre_critical,                          # tyre_critical
                     
                     # Temperature
-                    'brake_temp': list(p.brakeTemp),
-                    'tyre_core_temp': list(p.tyreCoreTemperature),
-                    'air_temp': p.airTemp,
-                    'road_temp': p.roadTemp,
+                    v_brake_temp.tolist(),                  # brake_temp
+                    v_core_temp.tolist(),                   # tyre_core_temp
+                    p.airTemp,                              # air_temp
+                    p.roadTemp,                             # road_temp
                     
                     # Track limits and lap
-                    'number_of_tyres_out': p.numberOfTyresOut,
-                    'is_lap_valid': is_lap_valid,
-                    'completed_laps': g.completedLaps,
-                    'current_time': g.iCurrentTime,
-                    'last_time': g.iLastTime,
-                    'best_time': g.iBestTime,
-                    'distance_traveled': g.distanceTraveled,
-                    'normalized_position': g.normalizedCarPosition,
-                    'current_sector_index': g.currentSectorIndex,
+                    p.numberOfTyresOut,                     # number_of_tyres_out
+                    is_lap_valid,                           # is_lap_valid
+                    completed_laps,                         # completed_laps
+                    g.iCurrentTime,                         # current_time
+                    g.iLastTime,                            # last_time
+                    g.iBestTime,                            # best_time
+                    g.distanceTraveled,                     # distance_traveled
+                    g.normalizedCarPosition,                # normalized_position
+                    g.currentSectorIndex,                   # current_sector_index
                     
                     # Track conditions
-                    'surface_grip': g.surfaceGrip,
+                    g.surfaceGrip,                          # surface_grip
                     
                     # Assists
-                    'tc': p.tc,
+                    p.tc,                                   # tc
                     
                     # Pit status
-                    'is_in_pit': bool(g.isInPit),
-                    'is_in_pit_lane': bool(g.isInPitLane),
+                    bool(g.isInPit),                        # is_in_pit
+                    bool(g.isInPitLane),                    # is_in_pit_lane
                     
                     # Fuel
-                    'fuel': p.fuel,
-                }
+                    p.fuel,                                 # fuel
+                ]
                 
-                # Broadcast to all connected clients
-                await self.broadcast(json.dumps(telemetry))
+                loop.call_soon_threadsafe(self._post_sample, samples, values)
                 
-                await asyncio.sleep(sleep_time)
+                next_deadline = self._sleep_until(next_deadline, sleep_time)
                 
         except Exception as e:
             logger.error("telemetry_loop_error", error=str(e))
         finally:
-            asm.close()
+            if asm is not None:
+                asm.close()
+            try:
+                loop.call_soon_threadsafe(self._post_sample, samples, None)
+            except RuntimeError:
+                pass  # Event loop already closed
             logger.info("telemetry_loop_stopped")
     
+    @staticmethod
+    def _sleep_until(deadline: float, period: float) -> float:
+        """Sleep until a perf_counter() deadline (if not already past); return the next one."""
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        return deadline + period
+    
+    @staticmethod
+    def _post_sample(samples: asyncio.Queue, values: Optional[list]):
+        """Queue a sample from the sampler thread (runs on the event loop)."""
+        if samples.full():
+            samples.get_nowait()  # Broadcast only the freshest sample
+        samples.put_nowait(values)
+    
+    async def read_telemetry_loop(self):
+        """
+        Read telemetry from AC and broadcast to all clients.
+        
+        This runs in parallel with the WebSocket server. Shared memory is
+        polled in a separate sampler thread (_sample_loop()); this coroutine
+        only collects samples into batches of batch_size and broadcasts them.
+        """
+        loop = asyncio.get_running_loop()
+        samples = asyncio.Queue(maxsize=1)
+        sampler = threading.Thread(
+            target=self._sample_loop, args=(loop, samples),
+            name="telemetry-sampler", daemon=True
+        )
+        sampler.start()
+        
+        batch = []  # Samples for the next frame (batch_size of them)
+        try:
+            while True:
+                values = await samples.get()
+                if values is None:
+                    break  # Sampler stopped
+                
+                # A batch only ever holds consecutive ticks: after a gap (no
+                # clients, or samples replaced while we were behind) the
+                # partial batch is flushed as a short frame
+                if batch and values[0] != batch[-1][0] + 1:
+                    await self._broadcast_batch(batch)
+                    batch.clear()
+                batch.append(values)
+                if len(batch) >= self.batch_size:
+                    await self._broadcast_batch(batch)
+                    batch.clear()
+            
+            # Flush a partial batch on a clean stop
+            if batch:
+                await self._broadcast_batch(batch)
+                
+        finally:
+            self.running = False  # Stops the sampler if this task is cancelled
+    
+    async def _broadcast_batch(self, batch: list):
+        """
+        Encode a batch of packet values once per packet format in use and broadcast it.
+        
+        With batch_size 1 each frame carries a single packet; otherwise a
+        list of packets (records back to back for binary clients).
+        """
+        batched = self.batch_size > 1
+        
+        # A packet object for plain JSON and msgpack clients (built only if
+        # any are connected), the bare value array for compact clients, one
+        # struct record for binary ones
+        compact_clients, msgpack_clients = self.compact_clients, self.msgpack_clients
+        binary_clients = self.binary_clients
+        n_json = (len(self.clients) - len(compact_clients)
+                  - len(msgpack_clients) - len(binary_clients))
+        if n_json or msgpack_clients:
+            packets = [dict(zip(FIELD_NAMES, values)) for values in batch]
+            telemetry = packets if batched else packets[0]
+        if n_json:
+            json_clients = None  # All of them
+            if compact_clients or msgpack_clients or binary_clients:
+                json_clients = self.clients - compact_clients - msgpack_clients - binary_clients
+            await self.broadcast(_encode_packet(telemetry), json_clients)
+        if compact_clients:
+            await self.broadcast(_encode_packet(batch if batched else batch[0]), compact_clients)
+        if msgpack_clients:
+            await self.broadcast(
+                msgpack.packb(telemetry, use_single_float=True), msgpack_clients, text=False
+            )
+        if binary_clients:
+            frame = b''.join(map(_pack_binary, batch)) if batched else _pack_binary(batch[0])
+            await self.broadcast(frame, binary_clients, text=False)
+    
     async def start(self):
         """
         Start the WebSocket server and telemetry loop.
@@ -249,8 +634,21 @@ class TelemetryServer:
         
         logger.info("starting_server", host=self.host, port=self.port, rate_hz=self.rate_hz)
         
-        # Start WebSocket server
-        async with websockets.serve(self.handler, self.host, self.port):
+        # Start WebSocket server (websockets' own compression default is
+        # always disabled; deflate is only offered through the tuned factory)
+        extensions = None
+        if self.compression == "deflate":
+            extensions = [ServerPerMessageDeflateFactory(
+                server_max_window_bits=12, compress_settings={"memLevel": 5}
+            )]
+        # Clients never send anything but control frames, so inbound
+        # messages are capped small (max_size) and barely buffered (max_queue)
+        async with websockets.serve(
+            self.handler, self.host, self.port, select_subprotocol=_select_subprotocol,
+            compression=None, extensions=extensions,
+            ping_interval=self.ping_interval, ping_timeout=self.ping_interval,
+            max_size=4096, max_queue=4
+        ):
             logger.info("server_listening", url=f"ws://{self.host}:{self.port}")
             
             # Start telemetry broadcasting loop
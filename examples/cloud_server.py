@@ -6,21 +6,45 @@ and receives telemetry data. Run this on your cloud instance.
 
 Usage:
     python cloud_server.py --host 0.0.0.0 --port 8765
+
+Binary frames (cloud --format binary) are decoded with
+ac_bridge.websocket_client.decode_binary_telemetry.
 """
 
-import asyncio
+import sys
+import os
+# Add parent directory to path so we can import ac_bridge
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 import json
 import argparse
+import logging
+import time
 import websockets
+from websockets.extensions.permessage_deflate import ServerPerMessageDeflateFactory
 from websockets.server import WebSocketServerProtocol
 
+from ac_bridge.runtime import close_on_signals, run_loop, setup_logging
+from ac_bridge.websocket_client import decode_binary_telemetry
+
+# Use orjson's faster parser when it's installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+logger = logging.getLogger("cloud_server")
+
+REPORT_INTERVAL = 1.0  # Seconds between status lines
+
 
 class TelemetryReceiver:
     """Simple telemetry receiving server."""
     
-    def __init__(self, host: str = "0.0.0.0", port: int = 8765):
+    def __init__(self, host: str = "0.0.0.0", port: int = 8765, compression: str = "deflate"):
         self.host = host
         self.port = port
+        self.compression = compression  # "deflate" or "none"
         self.packet_count = 0
         
     async def handler(self, websocket: WebSocketServerProtocol):
@@ -28,19 +52,33 @@ class TelemetryReceiver:
         remote = websocket.remote_address
         print(f"[{remote[0]}:{remote[1]}] Client connected")
         
+        last_report = time.monotonic()
+        last_count = self.packet_count
+        
         try:
             async for message in websocket:
-                self.packet_count += 1
+                if isinstance(message, bytes):
+                    # Binary format: fixed-size records, one or more per frame
+                    packets = decode_binary_telemetry(message)
+                else:
+                    # Parse telemetry (a JSON array when the client batches packets)
+                    data = json_loads(message)
+                    packets = data if isinstance(data, list) else [data]
                 
-                # Parse telemetry
-                data = json.loads(message)
+                self.packet_count += len(packets)
                 
-                # Example: Print key metrics every 10 packets
-                if self.packet_count % 10 == 0:
-                    print(f"[#{self.packet_count}] "
-                          f"Speed: {data['speed_kmh']:.1f} km/h | "
-                          f"Lap: {data['completed_laps']} | "
-                          f"Valid: {data['is_lap_valid']}")
+                # Example: Log key metrics of the latest packet, at most once
+                # per REPORT_INTERVAL
+                now = time.monotonic()
+                if now - last_report >= REPORT_INTERVAL:
+                    packet = packets[-1]
+                    logger.info("[#%d] %.1f pkt/s | Speed: %.1f km/h | Lap: %d | Valid: %s",
+                                self.packet_count,
+                                (self.packet_count - last_count) / (now - last_report),
+                                packet['speed_kmh'], packet['completed_laps'],
+                                packet['is_lap_valid'])
+                    last_report = now
+                    last_count = self.packet_count
                 
                 # TODO: Process telemetry for RL training
                 # - Store in buffer
@@ -59,24 +97,43 @@ class TelemetryReceiver:
         print("TELEMETRY RECEIVER (Cloud Server)")
         print("="*70)
         print(f"\nListening on {self.host}:{self.port}")
+        print(f"Compression: {self.compression}")
         print("Waiting for Windows bridge to connect...\n")
         
-        async with websockets.serve(self.handler, self.host, self.port):
-            await asyncio.Future()  # Run forever
+        # Cross-internet link: accept permessage-deflate, with a 4 KB window
+        # and memLevel 5 instead of zlib's 32 KB / 8 (the packets are small)
+        extensions = None
+        if self.compression == "deflate":
+            extensions = [ServerPerMessageDeflateFactory(
+                server_max_window_bits=12, compress_settings={"memLevel": 5}
+            )]
+        
+        async with websockets.serve(
+            self.handler, self.host, self.port, compression=None, extensions=extensions
+        ) as server:
+            # Close on SIGINT/SIGTERM and let the handlers finish
+            close_on_signals(server)
+            await server.wait_closed()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Cloud telemetry receiver")
     parser.add_argument('--host', default='0.0.0.0', help='Server host (default: 0.0.0.0)')
     parser.add_argument('--port', type=int, default=8765, help='Server port (default: 8765)')
+    parser.add_argument('--compression', choices=['deflate', 'none'], default='deflate',
+                        help='permessage-deflate for the incoming stream (default: deflate)')
     args = parser.parse_args()
     
-    receiver = TelemetryReceiver(host=args.host, port=args.port)
+    receiver = TelemetryReceiver(host=args.host, port=args.port, compression=args.compression)
+    listener = setup_logging()
     
     try:
-        asyncio.run(receiver.start())
+        run_loop(receiver.start())
     except KeyboardInterrupt:
-        print("\n\nServer stopped")
+        pass  # Ctrl+C without signal handlers (Windows)
+    finally:
+        listener.stop()
+    print("\n\nServer stopped")
 
 
 if __name__ == "__main__":
@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import time
 from ac_bridge.telemetry.ac_native_memory import ACSharedMemory
 from ac_bridge.control import VJoyController
+from ac_bridge.timing import Ticker
 
 
 def simple_speed_controller(target_speed_kmh: float = 100.0, kp: float = 0.01):
@@ -31,22 +32,32 @@ def simple_speed_controller(target_speed_kmh: float = 100.0, kp: float = 0.01):
     
     asm = ACSharedMemory()
     controller = VJoyController(device_id=1)
+    ticker = None  # 20 Hz; (re)started once AC is connected
     
     try:
         while True:
             if not asm.is_connected():
                 print("Waiting for AC...", end='\r')
                 time.sleep(1)
+                ticker = None  # Don't burst to catch up after the wait
                 continue
             
+            if ticker is None:
+                ticker = Ticker(hz=20)
+            
             # Read telemetry
             p = asm.physics
             current_speed = p.speedKmh
             
             # Simple P controller
             error = target_speed_kmh - current_speed
-            throttle = max(0.0, min(1.0, kp * error))
-            brake = max(0.0, min(1.0, -kp * error)) if error < 0 else 0.0
+            u = kp * error  # > 0: throttle, < 0: brake, clamped to 1.0
+            if u > 0.0:
+                throttle = u if u < 1.0 else 1.0
+                brake = 0.0
+            else:
+                throttle = 0.0
+                brake = -u if u > -1.0 else 1.0
             
             # Apply control
             controller.set_controls(
@@ -55,17 +66,19 @@ def simple_speed_controller(target_speed_kmh: float = 100.0, kp: float = 0.01):
                 steering=0.0  # Keep straight
             )
             
-            # Display status
-            print(
-                f"Speed: {current_speed:6.1f} km/h | "
-                f"Target: {target_speed_kmh:6.1f} | "
-                f"Error: {error:+6.1f} | "
-                f"Throttle: {throttle:.2f} | "
-                f"Brake: {brake:.2f}",
-                end='\r'
-            )
+            # Display status at 2 Hz (every 10th tick); the console doesn't
+            # need 20 redraws a second, the control loop does
+            if ticker.seq % 10 == 0:
+                print(
+                    f"Speed: {current_speed:6.1f} km/h | "
+                    f"Target: {target_speed_kmh:6.1f} | "
+                    f"Error: {error:+6.1f} | "
+                    f"Throttle: {throttle:.2f} | "
+                    f"Brake: {brake:.2f}",
+                    end='\r'
+                )
             
-            time.sleep(0.05)  # 20 Hz
+            ticker.tick()  # Drift-free 20 Hz
             
     except KeyboardInterrupt:
         print("\n\nStopped by user")
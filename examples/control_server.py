@@ -7,6 +7,11 @@ command or integrate into your training loop.
 
 Usage:
     python control_server.py --host 0.0.0.0 --port 8766
+
+Commands are JSON objects ({"throttle": ..., "brake": ..., "steering": ...,
+"clutch": ..., "gear": ...}; all optional) in text or binary frames or,
+cheaper, binary frames from
+ac_bridge.protocol.Codec.encode_control_fast(ControlCommand(...)).
 """
 
 import sys
@@ -14,12 +19,25 @@ import os
 # Add parent directory to path so we can import ac_bridge
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-import asyncio
 import json
 import argparse
+import logging
+import time
 import websockets
 from websockets.server import WebSocketServerProtocol
 
+from ac_bridge.runtime import close_on_signals, run_loop, setup_logging
+
+# Use orjson's faster parser when it's installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+logger = logging.getLogger("control_server")
+
+REPORT_INTERVAL = 1.0  # Seconds between status lines
+
 
 class ControlServer:
     """WebSocket server that applies received controls to vJoy."""
@@ -34,6 +52,7 @@ class ControlServer:
     async def handler(self, websocket: WebSocketServerProtocol):
         """Handle incoming control commands."""
         from ac_bridge.control import VJoyController
+        from ac_bridge.protocol import Codec
         
         remote = websocket.remote_address
         print(f"[{remote[0]}:{remote[1]}] Client connected")
@@ -48,34 +67,49 @@ class ControlServer:
                 await websocket.close()
                 return
         
+        last_report = time.monotonic()
+        
         try:
             async for message in websocket:
                 self.packet_count += 1
                 
                 try:
-                    # Parse control command
-                    controls = json.loads(message)
+                    # Parse control command into locals, once
+                    if isinstance(message, bytes) and Codec.is_control_fast(message):
+                        # Fixed 25-byte CONTROL frame: no dict at all
+                        cmd = Codec.decode_control_fast(message)
+                        throttle, brake, steering, clutch, gear = (
+                            cmd.throttle, cmd.brake, cmd.steer, cmd.clutch, cmd.gear
+                        )
+                    else:
+                        # JSON, in a text or a binary frame
+                        get = json_loads(message).get
+                        throttle = get('throttle', 0.0)
+                        brake = get('brake', 0.0)
+                        steering = get('steering', 0.0)
+                        clutch = get('clutch', 0.0)
+                        gear = get('gear')
                     
                     # Apply to vJoy
                     self.controller.set_controls(
-                        throttle=controls.get('throttle', 0.0),
-                        brake=controls.get('brake', 0.0),
-                        steering=controls.get('steering', 0.0),
-                        clutch=controls.get('clutch', 0.0)
+                        throttle=throttle,
+                        brake=brake,
+                        steering=steering,
+                        clutch=clutch
                     )
                     
                     # Optional gear
-                    if 'gear' in controls:
-                        self.controller.set_gear(controls['gear'])
+                    if gear is not None:
+                        self.controller.set_gear(gear)
                     
-                    # Log periodically
-                    if self.packet_count % 60 == 0:
-                        print(f"[#{self.packet_count}] "
-                              f"T:{controls.get('throttle', 0):.2f} "
-                              f"B:{controls.get('brake', 0):.2f} "
-                              f"S:{controls.get('steering', 0):+.2f}")
+                    # Log at most once per REPORT_INTERVAL
+                    now = time.monotonic()
+                    if now - last_report >= REPORT_INTERVAL:
+                        last_report = now
+                        logger.info("[#%d] T:%.2f B:%.2f S:%+.2f",
+                                    self.packet_count, throttle, brake, steering)
                     
-                except json.JSONDecodeError:
+                except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
                     print(f"Invalid JSON: {message[:50]}")
                 except Exception as e:
                     print(f"Error applying control: {e}")
@@ -98,8 +132,10 @@ class ControlServer:
         print(f"vJoy device: {self.device_id}")
         print("\nWaiting for control commands...\n")
         
-        async with websockets.serve(self.handler, self.host, self.port):
-            await asyncio.Future()  # Run forever
+        async with websockets.serve(self.handler, self.host, self.port) as server:
+            # Close on SIGINT/SIGTERM and let the handlers finish
+            close_on_signals(server)
+            await server.wait_closed()
 
 
 def main():
@@ -110,11 +146,15 @@ def main():
     args = parser.parse_args()
     
     server = ControlServer(host=args.host, port=args.port, device_id=args.device_id)
+    listener = setup_logging()
     
     try:
-        asyncio.run(server.start())
+        run_loop(server.start())
     except KeyboardInterrupt:
-        print("\n\nServer stopped")
+        pass  # Ctrl+C without signal handlers (Windows)
+    finally:
+        listener.stop()
+    print("\n\nServer stopped")
 
 
 if __name__ == "__main__":
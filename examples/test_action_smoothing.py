@@ -15,9 +15,11 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import time
+from dataclasses import replace
 import numpy as np
 from ac_bridge import (
     ACBridgeLocal,
+    Ticker,
     get_moderate_config,
     get_aggressive_config,
     get_conservative_config,
@@ -37,6 +39,7 @@ def test_step_inputs(bridge: ACBridgeLocal, duration_secs: float = 3.0):
     
     steps_per_second = 10  # Control rate
     total_steps = int(duration_secs * steps_per_second)
+    ticker = Ticker(hz=steps_per_second)  # Drift-free control rate
     
     for step in range(total_steps):
         # Step input: 0 -> 1.0 halfway through
@@ -59,7 +62,7 @@ def test_step_inputs(bridge: ACBridgeLocal, duration_secs: float = 3.0):
                 avg_delta = stats.get('avg_steer_delta', 0)
                 print(f"  Step {step:02d}: target={target_steer:.1f}, avg_delta={avg_delta:.3f}")
         
-        time.sleep(1.0 / steps_per_second)
+        ticker.tick()
     
     # Final stats
     stats = bridge.get_smoother_stats()
@@ -84,15 +87,16 @@ def test_noisy_inputs(bridge: ACBridgeLocal, duration_secs: float = 3.0):
     
     steps_per_second = 10
     total_steps = int(duration_secs * steps_per_second)
+    ticker = Ticker(hz=steps_per_second)  # Drift-free control rate
     
-    for step in range(total_steps):
-        t = step / steps_per_second
-        
-        # Smooth sine + noise
-        clean_steer = 0.5 * np.sin(2 * np.pi * 0.3 * t)  # 0.3 Hz sine
-        noise = np.random.normal(0, 0.1)  # 10% noise
-        noisy_steer = clean_steer + noise
-        
+    # Smooth sine + noise, for the whole run up front: one vectorized sin
+    # and one batch of noise instead of per-step NumPy calls
+    t = np.arange(total_steps) / steps_per_second
+    clean_steer = 0.5 * np.sin(2 * np.pi * 0.3 * t)  # 0.3 Hz sine
+    noise = np.random.default_rng().normal(0, 0.1, size=total_steps)  # 10% noise
+    noisy_targets = (clean_steer + noise).tolist()  # Python floats for apply_action()
+    
+    for step, noisy_steer in enumerate(noisy_targets):
         bridge.apply_action(
             steer=noisy_steer,
             throttle=0.4,
@@ -105,7 +109,7 @@ def test_noisy_inputs(bridge: ACBridgeLocal, duration_secs: float = 3.0):
                 avg_delta = stats.get('avg_steer_delta', 0)
                 print(f"  Step {step:02d}: noisy={noisy_steer:+.2f}, avg_delta={avg_delta:.3f}")
         
-        time.sleep(1.0 / steps_per_second)
+        ticker.tick()
     
     # Final stats
     stats = bridge.get_smoother_stats()
@@ -134,7 +138,7 @@ def main():
     bridge = ACBridgeLocal(
         telemetry_hz=60,
         control_hz=10,
-        smoothing_config=get_moderate_config()
+        smoothing_config=replace(get_moderate_config(), track_stats=True)
     )
     bridge.connect()
     
@@ -158,7 +162,7 @@ def main():
     bridge = ACBridgeLocal(
         telemetry_hz=60,
         control_hz=10,
-        smoothing_config=get_no_smoothing_config()
+        smoothing_config=replace(get_no_smoothing_config(), track_stats=True)
     )
     bridge.connect()
     